@@ -8,16 +8,19 @@ from __future__ import annotations
 import logging
 
 from textwrap import dedent
-from typing import TYPE_CHECKING, Final, Self, cast
+from typing import TYPE_CHECKING, Final, Self
 
 import click
 
 from .exitcode import ExitCode
-from .match import MatchArgument, MatchCommand, get_match_or_entity
+from .match import MatchArgument, MatchCommand, get_match_or_entity, require_match_or_entity
 from .objects import is_object_mixin
 
 if TYPE_CHECKING:
+    from collections.abc import Sequence
+
     from .state import State
+    from ...libvirt.entity import RunnableEntity
 
 LOGGER: Final = logging.getLogger(__name__)
 
@@ -51,28 +54,28 @@ class AutostartCommand(MatchCommand):
             entity: str | None,
             enable: bool
         ) -> None:
-            from collections.abc import Sequence
-
-            from ...libvirt.entity import RunnableEntity
             from ...libvirt.exceptions import InsufficientPrivileges
             from ...util.report import summary
 
+            require_match_or_entity(obj=self, ctx=ctx, match=match, entity=entity)
+
             with state.hypervisor as hv:
-                entities = cast(Sequence[RunnableEntity], get_match_or_entity(
+                entities: Sequence[RunnableEntity] = get_match_or_entity(  # type: ignore[assignment]
                     obj=self,
                     hv=hv,
                     match=match,
                     entity=entity,
                     ctx=ctx,
-                ))
+                )
 
+                idempotent = state.idempotent
                 success = 0
                 skipped = 0
 
                 for e in entities:
                     if e.autostart == enable:
                         skipped += 1
-                        if state.idempotent:
+                        if idempotent:
                             success += 1
                     else:
                         try:
@@ -92,7 +95,7 @@ class AutostartCommand(MatchCommand):
                     total=len(entities),
                     success=success,
                     skipped=skipped,
-                    idempotent=state.idempotent,
+                    idempotent=idempotent,
                 ))
 
                 if success != len(entities) or (not entities and state.fail_if_no_match):
@@ -5,6 +5,8 @@
 
 from __future__ import annotations
 
+import functools
+
 from dataclasses import dataclass
 from typing import TYPE_CHECKING, Self, cast
 
@@ -14,7 +16,7 @@ from .command import Command
 from .exitcode import ExitCode
 
 if TYPE_CHECKING:
-    from collections.abc import Iterable, Mapping
+    from collections.abc import Callable, Iterable, Mapping
 
     from .group import Group
     from .state import State
@@ -36,19 +38,37 @@ def make_alias_help(aliases: Mapping[str, MatchAlias], group_name: str) -> str:
 
 @dataclass(kw_only=True, slots=True)
 class HelpTopic:
-    '''Class representing a supplementary help topic.'''
+    '''Class representing a supplementary help topic.
+
+       `help_text` may be either a string, or a function taking no
+       arguments that returns the help text. The latter is useful for
+       help text that is expensive to generate and may never be needed.'''
     name: str
     description: str
-    help_text: str
+    help_text: str | Callable[[], str]
+
+    def get_help_text(self: Self) -> str:
+        '''Return the help text for this topic.'''
+        if callable(self.help_text):
+            return self.help_text()
+
+        return self.help_text
 
 
 class AliasHelpTopic(HelpTopic):
-    '''Special help topic class for info about matching aliases.'''
+    '''Special help topic class for info about matching aliases.
+
+       The help text is only generated the first time it is needed,
+       and is then reused for any further requests.'''
     def __init__(self: Self, aliases: Mapping[str, MatchAlias], group_name: str, doc_name: str) -> None:
+        @functools.cache
+        def help_text() -> str:
+            return make_alias_help(aliases, group_name)
+
         super().__init__(
             name='aliases',
             description=f'List recognized match aliases for matching { doc_name }s.',
-            help_text=make_alias_help(aliases, group_name),
+            help_text=help_text,
         )
 
 
@@ -95,7 +115,7 @@ class HelpCommand(Command):
                     click.echo(group.get_help(ctx))
                     ctx.exit(ExitCode.SUCCESS)
                 case t if t in topic_map:
-                    click.echo(topic_map[t].help_text)
+                    click.echo(topic_map[t].get_help_text())
                     ctx.exit(ExitCode.SUCCESS)
                 case t:
                     subcmd = group.get_command(ctx, topic)
@@ -48,16 +48,19 @@ class InfoCommand(Command):
                 else:
                     obj = self.get_entity(ctx, hv, entity)
 
-                for item in self.DISPLAY_PROPS.values():
-                    value = getattr(obj, item.prop, None)
-
-                    if value is not None and value != '':
-                        if item.use_units:
-                            v = state.convert_units(value)
-                        else:
-                            v = value
-
-                        output += f'  { item.name }: { item.color(v) }\n'
+                # Entering the object's context lets properties read
+                # from the configuration share a single fetch of it.
+                with obj:
+                    for item in self.DISPLAY_PROPS.values():
+                        value = getattr(obj, item.prop, None)
+
+                        if value is not None and value != '':
+                            if item.use_units:
+                                v = state.convert_units(value)
+                            else:
+                                v = value
+
+                            output += f'  { item.name }: { item.color(v) }\n'
 
             click.echo(output.rstrip())
 
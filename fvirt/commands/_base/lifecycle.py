@@ -15,7 +15,7 @@ from typing import TYPE_CHECKING, Any, Final, Self
 import click
 
 from .exitcode import ExitCode
-from .match import MatchArgument, MatchCommand, get_match_or_entity
+from .match import MatchArgument, MatchCommand, get_match_or_entity, require_match_or_entity
 from .objects import is_object_mixin
 
 if TYPE_CHECKING:
@@ -26,7 +26,7 @@ if TYPE_CHECKING:
 LOGGER: Final = logging.getLogger(__name__)
 
 
-@dataclass(kw_only=True, slots=True)
+@dataclass(kw_only=True, slots=True, frozen=True)
 class OperationHelpInfo:
     '''Terms for templating into a lifecycle command help text.'''
     verb: str
@@ -35,6 +35,26 @@ class OperationHelpInfo:
     idempotent_state: str
 
 
+_START_HELP: Final = OperationHelpInfo(
+    verb='start',
+    continuous='starting',
+    past='started',
+    idempotent_state='started',
+)
+_STOP_HELP: Final = OperationHelpInfo(
+    verb='stop',
+    continuous='stopping',
+    past='stopped',
+    idempotent_state='stopped',
+)
+_UNDEFINE_HELP: Final = OperationHelpInfo(
+    verb='undefine',
+    continuous='undefining',
+    past='undefined',
+    idempotent_state='undefined',
+)
+
+
 class LifecycleCommand(MatchCommand):
     '''Class for object lifecycle commands.
 
@@ -67,6 +87,20 @@ class LifecycleCommand(MatchCommand):
             ) -> None:
         assert is_object_mixin(self)
 
+        # These only depend on the command, so build them once here and
+        # let logging fill in the entity identifier when it actually
+        # emits a message.
+        lookup_failed_msg = f'Unable to look up { self.NAME } "%s".'
+        not_found_msg = f'Could not find { self.NAME } "%s".'
+        error_msg = f'Unexpected error processing { self.NAME } "%s".'
+        success_msg = f'{ op_help.continuous.capitalize() } { self.NAME } "%s".'
+        noop_msg = f'{ self.NAME.capitalize() } "%s" is already { op_help.idempotent_state }.'
+        failure_msg = f'Failed to { op_help.verb } { self.NAME } "%s".'
+        timed_out_msg = f'Timed out waiting for { self.NAME } "%s" to { op_help.verb }.'
+        forced_msg = f'{ self.NAME.capitalize() } "%s" failed to { op_help.verb } and was forced to do so anyway.'
+        unsupported_msg = f'Failed to { op_help.verb } { self.NAME }, operation is not supported for this { self.NAME }.'
+        unexpected_msg = f'Encountered unexpected error while attempting to { op_help.verb } { self.NAME }'
+
         def cb(
             ctx: click.Context,
             state: State,
@@ -83,16 +117,30 @@ class LifecycleCommand(MatchCommand):
             from ...libvirt.runner import RunnerResult, run_entity_method, run_sub_entity_method
             from ...util.report import summary
 
+            require_match_or_entity(obj=self, ctx=ctx, match=match, entity=entity)
+
+            fail_fast = state.fail_fast
+            idempotent = state.idempotent
+
             if op_help.idempotent_state:
-                kwargs['idempotent'] = state.idempotent
+                kwargs['idempotent'] = idempotent
 
             with state.hypervisor as hv:
                 uri = hv.uri
 
                 if parent is not None:
                     parent_obj = self.get_parent_obj(ctx, hv, parent)
+                    entities = get_match_or_entity(
+                        hv=hv,
+                        obj=self,
+                        match=match,
+                        entity=entity,
+                        ctx=ctx,
+                        parent=parent_obj,
+                    )
+                    pool = state.get_pool(len(entities))
 
-                    futures = [state.pool.submit(
+                    futures = [pool.submit(
                         run_sub_entity_method,  # type: ignore
                         uri=uri,
                         hvprop=self.PARENT_ATTR,
@@ -100,17 +148,20 @@ class LifecycleCommand(MatchCommand):
                         method=method,
                         ident=(parent_obj.name, e.name),
                         arguments=args,
-                        kwarguments=kwargs
-                    ) for e in get_match_or_entity(
+                        kwarguments=kwargs,
+                        start_event_loop=False,
+                    ) for e in entities]
+                else:
+                    entities = get_match_or_entity(
                         hv=hv,
                         obj=self,
                         match=match,
                         entity=entity,
                         ctx=ctx,
-                        parent=parent_obj.name,
-                    )]
-                else:
-                    futures = [state.pool.submit(
+                    )
+                    pool = state.get_pool(len(entities))
+
+                    futures = [pool.submit(
                         run_entity_method,  # type: ignore
                         uri=uri,
                         hvprop=self.LOOKUP_ATTR,
@@ -118,14 +169,10 @@ class LifecycleCommand(MatchCommand):
                         ident=e.name,
                         arguments=args,
                         kwarguments=kwargs,
-                    ) for e in get_match_or_entity(
-                        hv=hv,
-                        obj=self,
-                        match=match,
-                        entity=entity,
-                        ctx=ctx,
-                    )]
+                        start_event_loop=False,
+                    ) for e in entities]
 
+            total = len(futures)
             success = 0
             skipped = 0
             timed_out = 0
@@ -136,67 +183,67 @@ class LifecycleCommand(MatchCommand):
                 try:
                     match f.result():
                         case RunnerResult(attrs_found=False) as r:
-                            LOGGER.error(f'Unable to look up { self.NAME } "{ r.ident }".')
+                            LOGGER.error(lookup_failed_msg, r.ident)
                             ctx.exit(ExitCode.OPERATION_FAILED)
                         case RunnerResult(entity_found=False) as r:
-                            LOGGER.error(f'Could not find { self.NAME } "{ r.ident }".')
+                            LOGGER.error(not_found_msg, r.ident)
                             not_found += 1
 
-                            if state.fail_fast:
+                            if fail_fast:
                                 break
                         case RunnerResult(method_success=False) as r:
-                            LOGGER.error(f'Unexpected error processing { self.NAME } "{ r.ident }".')
+                            LOGGER.error(error_msg, r.ident)
 
-                            if state.fail_fast:
+                            if fail_fast:
                                 break
                         case RunnerResult(method_success=True, result=LifecycleResult.SUCCESS) as r:
-                            LOGGER.info(f'{ op_help.continuous.capitalize() } { self.NAME } "{ r.ident }".')
+                            LOGGER.info(success_msg, r.ident)
                             success += 1
                         case RunnerResult(method_success=True, result=LifecycleResult.NO_OPERATION) as r:
-                            LOGGER.info(f'{ self.NAME.capitalize() } "{ r.ident }" is already { op_help.idempotent_state }.')
+                            LOGGER.info(noop_msg, r.ident)
                             skipped += 1
 
-                            if state.idempotent:
+                            if idempotent:
                                 success += 1
                         case RunnerResult(method_success=True, result=LifecycleResult.FAILURE) as r:
-                            LOGGER.warning(f'Failed to { op_help.verb } { self.NAME } "{ r.ident }".')
+                            LOGGER.warning(failure_msg, r.ident)
 
-                            if state.fail_fast:
+                            if fail_fast:
                                 break
                         case RunnerResult(method_success=True, result=LifecycleResult.TIMED_OUT) as r:
-                            LOGGER.warning(f'Timed out waiting for { self.NAME } "{ r.ident }" to { op_help.verb }.')
+                            LOGGER.warning(timed_out_msg, r.ident)
                             timed_out += 1
 
-                            if state.fail_fast:
+                            if fail_fast:
                                 break
                         case RunnerResult(method_success=True, result=LifecycleResult.FORCED) as r:
-                            LOGGER.warning(f'{ self.NAME.capitalize() } "{ r.ident }" failed to { op_help.verb } and was forced to do so anyway.')
+                            LOGGER.warning(forced_msg, r.ident)
                             forced += 1
                         case _:
                             raise RuntimeError
                 except InvalidOperation:
-                    LOGGER.error(f'Failed to { op_help.verb } { self.NAME }, operation is not supported for this { self.NAME }.')
+                    LOGGER.error(unsupported_msg)
 
-                    if state.fail_fast:
+                    if fail_fast:
                         break
                 except Exception as e:
-                    LOGGER.error('Encountered unexpected error while attempting to { op_help.verb } { self.NAME }', exc_info=e)
+                    LOGGER.error(unexpected_msg, exc_info=e)
 
-                    if state.fail_fast:
+                    if fail_fast:
                         break
 
             click.echo(f'Finished { op_help.continuous } specified { self.NAME }s.')
             click.echo('')
             click.echo(summary(
-                total=len(futures),
+                total=total,
                 success=success,
                 skipped=skipped,
                 forced=forced,
                 timed_out=timed_out,
-                idempotent=state.idempotent,
+                idempotent=idempotent,
             ))
 
-            if success != len(futures) or (not futures and state.fail_if_no_match):
+            if success != total or (not total and state.fail_if_no_match):
                 ctx.exit(ExitCode.OPERATION_FAILED)
 
         params = tuple(params) + self.mixin_params(required=False)
@@ -302,13 +349,7 @@ class StartCommand(SimpleLifecycleCommand):
     def METHOD(self: Self) -> str: return 'start'
 
     @property
-    def OP_HELP(self: Self) -> OperationHelpInfo:
-        return OperationHelpInfo(
-            verb='start',
-            continuous='starting',
-            past='started',
-            idempotent_state='started',
-        )
+    def OP_HELP(self: Self) -> OperationHelpInfo: return _START_HELP
 
 
 class StopCommand(SimpleLifecycleCommand):
@@ -320,13 +361,7 @@ class StopCommand(SimpleLifecycleCommand):
     def METHOD(self: Self) -> str: return 'destroy'
 
     @property
-    def OP_HELP(self: Self) -> OperationHelpInfo:
-        return OperationHelpInfo(
-            verb='stop',
-            continuous='stopping',
-            past='stopped',
-            idempotent_state='stopped',
-        )
+    def OP_HELP(self: Self) -> OperationHelpInfo: return _STOP_HELP
 
 
 class UndefineCommand(SimpleLifecycleCommand):
@@ -338,10 +373,4 @@ class UndefineCommand(SimpleLifecycleCommand):
     def METHOD(self: Self) -> str: return 'undefine'
 
     @property
-    def OP_HELP(self: Self) -> OperationHelpInfo:
-        return OperationHelpInfo(
-            verb='undefine',
-            continuous='undefining',
-            past='undefined',
-            idempotent_state='undefined',
-        )
+    def OP_HELP(self: Self) -> OperationHelpInfo: return _UNDEFINE_HELP
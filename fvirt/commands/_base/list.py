@@ -7,6 +7,8 @@ from __future__ import annotations
 
 import logging
 
+from itertools import chain, islice
+from operator import attrgetter
 from textwrap import dedent
 from typing import TYPE_CHECKING, Final, Self
 
@@ -19,7 +21,7 @@ from .tables import ColumnsParam, column_info, render_table, tabulate_entities
 from ...util.match import MatchArgument
 
 if TYPE_CHECKING:
-    from collections.abc import Sequence
+    from collections.abc import Iterable, Sequence
 
     from .state import State
     from ...libvirt import Hypervisor
@@ -94,26 +96,49 @@ class ListCommand(MatchCommand):
                     obj = hv
 
                 if match is None:
-                    entities = getattr(obj, self.LOOKUP_ATTR)
+                    found: Iterable[Entity] = getattr(obj, self.LOOKUP_ATTR)
                 else:
-                    entities = getattr(obj, self.LOOKUP_ATTR).match(match)
+                    found = getattr(obj, self.LOOKUP_ATTR).match(match)
 
-                if not entities and state.fail_if_no_match:
-                    LOGGER.warning(f'No { self.NAME }s found matching the specified parameters.')
-                    ctx.exit(ExitCode.ENTITY_NOT_FOUND)
+                # The result of a match is a lazy iterator, which is always
+                # truthy, so check for an empty result by pulling the first
+                # entities instead of testing the iterable directly. Pulling
+                # up to two also tells us whether the thread pool is needed.
+                found_iter = iter(found)
+                head = tuple(islice(found_iter, 2))
+
+                if not head:
+                    if state.fail_if_no_match:
+                        LOGGER.warning(f'No { self.NAME }s found matching the specified parameters.')
+                        ctx.exit(ExitCode.ENTITY_NOT_FOUND)
+
+                entities: Iterable[Entity] = chain(head, found_iter)
 
                 if only is None:
-                    data = tabulate_entities(entities, self.DISPLAY_PROPS, selected, convert=lambda x: state.convert_units(x))
+                    columns = tuple(self.DISPLAY_PROPS[x] for x in selected)
+                    data = tabulate_entities(
+                        entities,
+                        self.DISPLAY_PROPS,
+                        selected,
+                        convert=state.convert_units,
+                        resolved=columns,
+                        pool=state.get_pool(len(head)),
+                    )
                 else:
-                    for e in entities:
-                        click.echo(getattr(e, only))
+                    values = '\n'.join(map(str, map(attrgetter(self.DISPLAY_PROPS[only].prop), entities)))
+
+                    if values:
+                        click.echo(values)
 
             if only is None:
-                click.echo(render_table(
+                output = render_table(
                     data,
-                    [self.DISPLAY_PROPS[x] for x in selected],
+                    columns,
                     headings=not no_headings,
-                ))
+                )
+
+                if output:
+                    click.echo(output)
 
         if self.HAS_PARENT:
             docstr = f'''
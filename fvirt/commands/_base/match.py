@@ -5,17 +5,18 @@
 
 from __future__ import annotations
 
+import functools
 import logging
 import re
 
-from typing import TYPE_CHECKING, Any, Concatenate, Final, ParamSpec, Self, Type, TypeVar, cast
+from typing import TYPE_CHECKING, Any, Concatenate, Final, ParamSpec, Self, Type, TypeVar
 
 import click
 
 from .command import Command
 from .exitcode import ExitCode
 from .objects import ObjectMixin, is_object_mixin
-from ...util.match import MatchAlias, MatchArgument, MatchTarget
+from ...util.match import MatchAlias, MatchArgument, MatchTarget, combine_matches
 
 if TYPE_CHECKING:
     from collections.abc import Callable, Mapping, Sequence
@@ -31,6 +32,17 @@ DEFAULT_MATCH: Final = re.compile('.*')
 LOGGER: Final = logging.getLogger(__name__)
 
 
+@functools.lru_cache(maxsize=64)
+def _xpath_target(xpath: str, /) -> MatchTarget:
+    '''Compile an XPath match target, reusing the result for repeated expressions.
+
+       Reusing the same MatchTarget instance also lets the cache in
+       fvirt.util.match.matcher() work for XPath targets.'''
+    from lxml import etree
+
+    return MatchTarget(xpath=etree.XPath(xpath, smart_strings=False))
+
+
 def MatchTargetParam(aliases: Mapping[str, MatchAlias]) -> Type[click.ParamType]:
     '''Factory function for creating types for match tagets.
 
@@ -50,9 +62,7 @@ def MatchTargetParam(aliases: Mapping[str, MatchAlias]) -> Type[click.ParamType]
                 if value in aliases:
                     ret = MatchTarget(property=aliases[value].property)
                 else:
-                    from lxml import etree
-
-                    ret = MatchTarget(xpath=etree.XPath(value, smart_strings=False))
+                    ret = _xpath_target(value)
             else:
                 ret = value
 
@@ -61,6 +71,12 @@ def MatchTargetParam(aliases: Mapping[str, MatchAlias]) -> Type[click.ParamType]
     return MatchTargetParam
 
 
+@functools.lru_cache(maxsize=256)
+def _compile_pattern(pattern: str, /) -> re.Pattern:
+    '''Compile a match pattern, reusing the result for repeated patterns.'''
+    return re.compile(pattern)
+
+
 class MatchPatternParam(click.ParamType):
     '''Class for processing match patterns.
 
@@ -71,7 +87,7 @@ class MatchPatternParam(click.ParamType):
     def convert(self: Self, value: str | re.Pattern | None, param: Any, ctx: click.core.Context | None) -> re.Pattern:
         if isinstance(value, str):
             try:
-                return re.compile(value)
+                return _compile_pattern(value)
             except re.error:
                 self.fail(f'"{ value }" is not a valid pattern.', param, ctx)
         elif value is None:
@@ -85,13 +101,19 @@ def get_match_or_entity(
         obj: ObjectMixin,
         hv: Hypervisor,
         ctx: click.core.Context,
-        match: tuple[MatchTarget, re.Pattern] | None,
+        match: MatchArgument | None,
         entity: str | None,
-        parent: str | None = None,
+        parent: str | Entity | None = None,
         ) -> Sequence[Entity]:
     '''Get a list of entities based on the given parameters.
 
-       This is a helper function intended to simplify writing callbacks for MatchCommands.'''
+       This is a helper function intended to simplify writing callbacks for MatchCommands.
+
+       If the caller has already looked up the parent object, it may
+       be passed as `parent` instead of an identifier to avoid looking
+       it up a second time.'''
+    from ...libvirt.entity import Entity
+
     entities: list[Entity] = []
     state: State = ctx.obj
 
@@ -99,7 +121,10 @@ def get_match_or_entity(
         if obj.HAS_PARENT:
             assert parent is not None
 
-            entities = list(obj.match_sub_entities(ctx, hv, parent, match))
+            if isinstance(parent, Entity):
+                entities = list(obj.match_entities(ctx, parent, match))
+            else:
+                entities = list(obj.match_sub_entities(ctx, hv, parent, match))
         else:
             entities = list(obj.match_entities(ctx, hv, match))
 
@@ -110,19 +135,49 @@ def get_match_or_entity(
         if obj.HAS_PARENT:
             assert parent is not None
 
-            item = obj.get_sub_entity(ctx, hv, parent, entity)
+            if isinstance(parent, Entity):
+                item = obj.get_entity(ctx, parent, entity)
+            else:
+                item = obj.get_sub_entity(ctx, hv, parent, entity)
         else:
             item = obj.get_entity(ctx, hv, entity)
 
         entities = [item]
     else:
-        usage = cast(click.Command, obj).get_usage(ctx)
+        require_match_or_entity(obj=obj, ctx=ctx, match=match, entity=entity)
+
+    return entities
+
+
+def require_match_or_entity(
+        *,
+        obj: ObjectMixin,
+        ctx: click.core.Context,
+        match: MatchArgument | None,
+        entity: str | None,
+        ) -> None:
+    '''Exit with a usage error if neither match parameters nor an entity were given.
+
+       Callbacks should call this before connecting to the hypervisor,
+       so that invalid invocations fail without opening a connection.'''
+    if match is None and entity is None:
+        cmd: click.Command = obj  # type: ignore[assignment]
+        usage = cmd.get_usage(ctx)
         click.echo(usage, err=True)
         click.echo('', err=True)
         click.echo(f'Either match parameters or a { obj.NAME } spicifier is required.', err=True)
         ctx.exit(ExitCode.BAD_ARGUMENTS)
 
-    return entities
+
+def _combine_match_params(ctx: click.Context, param: click.Parameter, value: Sequence[MatchArgument]) -> MatchArgument | None:
+    '''Click callback to merge repeated --match options into one.'''
+    if not value:
+        return None
+
+    try:
+        return combine_matches(value)
+    except ValueError as e:
+        raise click.BadParameter(str(e), ctx=ctx, param=param)
 
 
 class MatchCommand(Command):
@@ -143,7 +198,9 @@ class MatchCommand(Command):
             param_decls=('--match',),
             type=(MatchTargetParam(self.CLASS.MATCH_ALIASES)(), MatchPatternParam()),
             nargs=2,
-            help=f'Limit { self.NAME }s to operate on by match parameter. For more info, see `fvirt help matching`',
+            multiple=True,
+            callback=_combine_match_params,
+            help=f'Limit { self.NAME }s to operate on by match parameter. May be specified more than once. For more info, see `fvirt help matching`',
             default=None,
         ),)
 
@@ -162,4 +219,5 @@ __all__ = [
     'MatchCommand',
     'MatchArgument',
     'get_match_or_entity',
+    'require_match_or_entity',
 ]
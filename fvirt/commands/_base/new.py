@@ -81,6 +81,7 @@ class NewCommand(Command):
 
             assert is_object_mixin(self)
 
+            fail_fast = state.fail_fast
             success = 0
 
             if use_templating:
@@ -127,13 +128,12 @@ class NewCommand(Command):
                     LOGGER.error(f'Unable to create any { self.NAME }s, the hypervisor connection is read-only.')
                     ctx.exit(ExitCode.OPERATION_FAILED)
 
-                for conf in confdata:
-                    if self.HAS_PARENT:
-                        assert parent is not None
+                if self.HAS_PARENT:
+                    assert parent is not None
 
-                        define_obj: Hypervisor | Entity = self.get_parent_obj(ctx, hv, parent)
-                    else:
-                        define_obj = hv
+                    define_obj: Hypervisor | Entity = self.get_parent_obj(ctx, hv, parent)
+                else:
+                    define_obj = hv
 
                 for c, p in confdata:
                     try:
@@ -144,12 +144,12 @@ class NewCommand(Command):
                     except InvalidConfig:
                         LOGGER.warning(f'The configuration at { p } is not valid for a { self.NAME }')
 
-                        if state.fail_fast:
+                        if fail_fast:
                             break
                     except Exception as e:
                         LOGGER.error(f'Failed to create { self.NAME }', exc_info=e)
 
-                        if state.fail_fast:
+                        if fail_fast:
                             break
                     else:
                         LOGGER.info(f'Successfully created { self.NAME }: "{ obj.name }".')
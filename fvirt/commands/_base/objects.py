@@ -9,7 +9,7 @@ import logging
 
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
-from typing import TYPE_CHECKING, Any, Final, Self, Type, TypeGuard, cast
+from typing import TYPE_CHECKING, Any, Final, Self, Type, TypeGuard
 
 import click
 
@@ -20,6 +20,7 @@ if TYPE_CHECKING:
 
     from ...libvirt import Hypervisor
     from ...libvirt.entity import Entity
+    from ...libvirt.entity_access import EntityAccess
     from ...util.match import MatchArgument
 
 LOGGER: Final = logging.getLogger(__name__)
@@ -44,7 +45,7 @@ class DisplayProperty:
     prop: str
     use_units: bool = False
     right_align: bool = False
-    color: Callable[[Any], str] = lambda x: str(x)
+    color: Callable[[Any], str] = str
 
 
 class ObjectMixin(ABC):
@@ -165,10 +166,8 @@ class ObjectMixin(ABC):
 
     def get_entity(self: Self, ctx: click.Context, parent: Entity | Hypervisor, ident: Any) -> Entity:
         '''Look up an entity based on an identifier.'''
-        from ...libvirt.entity import Entity
-        from ...libvirt.entity_access import EntityAccess
-
-        entity = cast(EntityAccess[Entity], getattr(parent, self.LOOKUP_ATTR)).get(ident)
+        access: EntityAccess[Entity] = getattr(parent, self.LOOKUP_ATTR)
+        entity = access.get(ident)
 
         if entity is None:
             LOGGER.error(f'Could not find { self.NAME } "{ ident }"')
@@ -178,13 +177,11 @@ class ObjectMixin(ABC):
 
     def get_parent_obj(self: Self, ctx: click.Context, hv: Hypervisor, parent_ident: Any) -> Entity:
         '''Look up the parent object.'''
-        from ...libvirt.entity import Entity
-        from ...libvirt.entity_access import EntityAccess
-
         if self.PARENT_ATTR is None or self.PARENT_NAME is None:
             raise RuntimeError
 
-        parent = cast(EntityAccess[Entity], getattr(hv, self.PARENT_ATTR)).get(parent_ident)
+        access: EntityAccess[Entity] = getattr(hv, self.PARENT_ATTR)
+        parent = access.get(parent_ident)
 
         if not parent:
             LOGGER.error(f'Could not find { self.PARENT_NAME } "{ parent_ident }"')
@@ -200,9 +197,9 @@ class ObjectMixin(ABC):
 
     def match_entities(self: Self, ctx: click.Context, parent: Entity | Hypervisor, match: MatchArgument) -> Iterable[Entity]:
         '''Match a set of entities.'''
-        from ...libvirt.entity_access import EntityAccess
+        access: EntityAccess[Entity] = getattr(parent, self.LOOKUP_ATTR)
 
-        return cast(EntityAccess, getattr(parent, self.LOOKUP_ATTR)).match(match)
+        return access.match(match)
 
     def match_sub_entities(self: Self, ctx: click.Context, hv: Hypervisor, parent_ident: Any, match: MatchArgument) -> Iterable[Entity]:
         '''Match a set of entities that are children of another entity.'''
@@ -215,6 +215,18 @@ class State:
 
         return self.__pool
 
+    def get_pool(self: Self, count: int, /) -> ThreadPoolExecutor | DummyExecutor:
+        '''Get an executor to use for running `count` operations.
+
+           Operations on a single object bypass the thread pool
+           entirely, so they do not pay the cost of starting it.'''
+        if count > 1:
+            return self.pool
+
+        from ...util.dummy_pool import DummyExecutor
+
+        return DummyExecutor()
+
     def convert_units(self: Self, value: int) -> str:
         '''Convert units for output.'''
         if self.__units in {'raw', 'bytes'}:
@@ -5,12 +5,15 @@
 
 from __future__ import annotations
 
+import functools
+
 from typing import TYPE_CHECKING, Any, Final, Self, Type
 
 from .terminal import get_terminal
 
 if TYPE_CHECKING:
     from collections.abc import Callable, Iterable, Mapping, Sequence
+    from concurrent.futures import Executor
 
     import click
 
@@ -30,6 +33,8 @@ def ColumnsParam(cols: Mapping[str, DisplayProperty], type_name: str, /) -> Type
        a command option.'''
     import click
 
+    valid: Final = frozenset(cols)
+
     class ColumnsParam(click.ParamType):
         name = type_name
 
@@ -40,14 +45,14 @@ def ColumnsParam(cols: Mapping[str, DisplayProperty], type_name: str, /) -> Type
                 if value == 'list':
                     return ['list']
                 elif value == 'all':
-                    ret = [x for x in cols.keys()]
+                    ret = list(cols)
                 else:
-                    ret = [x.lstrip().rstrip() for x in value.split(',')]
+                    ret = [x.strip() for x in value.split(',')]
             else:
                 ret = value
 
             for item in ret:
-                if item not in cols.keys():
+                if item not in valid:
                     self.fail(f'{ item } is not a valid column name. Specify a value of "list" to list known columns.', param, ctx)
 
             return ret
@@ -71,14 +76,41 @@ def column_info(columns: Mapping[str, DisplayProperty], defaults: Sequence[str],
     return output
 
 
+@functools.cache
+def _colored_yes() -> str:
+    '''Return the colored string used by color_bool() for true values.
+
+       This is cached so the escape sequences are only built once,
+       while still deferring terminal initialization until needed.'''
+    ret: str = get_terminal().bright_green_on_black('Yes')
+
+    return ret
+
+
 def color_bool(value: bool) -> str:
     '''Produce a colored string from a boolean.'''
     if value:
-        return get_terminal().bright_green_on_black('Yes')
+        return _colored_yes()
     else:
         return 'No'
 
 
+def color_mapped(value: Any, styles: Mapping[Any, str], /) -> str:
+    '''Produce a colored string from a value using a mapping of styles.
+
+       `styles` maps values to the names of terminal formatting
+       attributes (such as `bright_green_on_black`). Values with no
+       entry in `styles` are returned uncolored.'''
+    style = styles.get(value)
+
+    if style is None:
+        return str(value)
+
+    ret: str = getattr(get_terminal(), style)(str(value))
+
+    return ret
+
+
 def color_optional(value: Any) -> str:
     '''Format an optionally empty attribute.'''
     if value is None:
@@ -92,28 +124,49 @@ def tabulate_entities(
     columns: Mapping[str, DisplayProperty],
     selected_cols: Sequence[str],
     /, *,
-    convert: Callable[[int], str] = lambda x: str(x),
+    convert: Callable[[int], str] = str,
+    resolved: Sequence[DisplayProperty] | None = None,
+    pool: Executor | None = None,
 ) -> Sequence[Sequence[str]]:
-    '''Convert an iterable of entities to a list of values for columns.'''
-    ret = []
+    '''Convert an iterable of entities to a list of values for columns.
 
-    for entity in entities:
+       If the caller has already looked up the DisplayProperty instances
+       for `selected_cols`, they can be passed as `resolved` to avoid
+       looking them up again.
+
+       If `pool` is specified, the values for each entity will be
+       fetched concurrently using that executor. The order of the
+       returned rows always matches the order of `entities`.'''
+    from operator import attrgetter
+
+    if resolved is None:
+        resolved = [columns[x] for x in selected_cols]
+
+    getters = [(attrgetter(x.prop), x.use_units) for x in resolved]
+
+    def get_row(entity: Entity) -> Sequence[str]:
         items = []
 
-        for column in selected_cols:
-            try:
-                prop = getattr(entity, columns[column].prop)
-            except AttributeError:
-                prop = '-'
-            else:
-                if columns[column].use_units:
-                    prop = convert(prop)
+        # Entering the entity's context lets all the columns share one
+        # fetch of the entity's configuration.
+        with entity:
+            for getter, use_units in getters:
+                try:
+                    prop = getter(entity)
+                except AttributeError:
+                    prop = '-'
+                else:
+                    if use_units:
+                        prop = convert(prop)
 
-            items.append(prop)
+                items.append(prop)
 
-        ret.append(items)
+        return items
 
-    return ret
+    if pool is None:
+        return [get_row(x) for x in entities]
+    else:
+        return list(pool.map(get_row, entities))
 
 
 def render_table(items: Sequence[Sequence[Any]], columns: Sequence[DisplayProperty], headings: bool = True) -> str:
@@ -124,45 +177,66 @@ def render_table(items: Sequence[Sequence[Any]], columns: Sequence[DisplayProper
 
        `columns` is a list of corresponding Column instances for the
        columns to be used for the table.'''
-    ret = ''
+    lines: list[str] = []
     TERM: Final = get_terminal()
-
-    column_sizes = [
-        max([
-            TERM.length(columns[i].color(row[i])) for row in items
-        ]) for i in range(0, len(columns))
+    measure = TERM.length
+    colors = [x.color for x in columns]
+    right_align = [x.right_align for x in columns]
+
+    plain = [x is str for x in colors]
+
+    # Color each cell only once, the same colored values are needed
+    # both for sizing the columns and for the actual output. Strings in
+    # columns without any coloring are used as-is.
+    cells = [
+        [item if plain[idx] and type(item) is str else colors[idx](item) for idx, item in enumerate(row)]
+        for row in items
     ]
+    lengths = [[measure(x) for x in row] for row in cells]
 
     if headings:
-        column_sizes = [
-            max(column_sizes[i], len(columns[i].title)) for i in range(0, len(columns))
-        ]
+        minimums = [len(x.title) for x in columns]
+    else:
+        minimums = [0] * len(columns)
 
-        for idx, column in enumerate(columns):
-            if columns[idx].right_align:
-                ret += f'  {column.title:>{column_sizes[idx]}}'
+    # Transposing the lengths lets max() find each column width in C.
+    column_sizes = [max(x) for x in zip(minimums, *lengths)]
+
+    if headings:
+        parts = []
+
+        for column, width in zip(columns, column_sizes):
+            if column.right_align:
+                parts.append('  ' + column.title.rjust(width))
             else:
-                ret += f'  {column.title:<{column_sizes[idx]}}'
+                parts.append('  ' + column.title.ljust(width))
+
+        lines.append(''.join(parts))
+        lines.append(TERM.bold('-' * (sum(column_sizes) + (2 * len(column_sizes)))))
+
+    for row, row_lengths in zip(cells, lengths):
+        parts = []
 
-        ret += '\n'
-        ret += (TERM.bold('-' * (sum(column_sizes) + (2 * len(column_sizes)))))
-        ret += '\n'
+        for item, length, width, right in zip(row, row_lengths, column_sizes, right_align):
+            # The lengths were already computed while sizing the
+            # columns, so pad directly instead of having the terminal
+            # measure each item again.
+            padding = ' ' * (width - length)
 
-    for row in items:
-        for idx, item in enumerate(row):
-            if columns[idx].right_align:
-                ret += f'  {TERM.rjust(columns[idx].color(item), width=column_sizes[idx])}'
+            if right:
+                parts.append('  ' + padding + item)
             else:
-                ret += f'  {TERM.ljust(columns[idx].color(item), width=column_sizes[idx])}'
+                parts.append('  ' + item + padding)
 
-        ret += '\n'
+        lines.append(''.join(parts))
 
-    return ret.rstrip()
+    return '\n'.join(lines).rstrip()
 
 
 __all__ = [
     'ColumnsParam',
     'color_bool',
+    'color_mapped',
     'color_optional',
     'column_info',
     'tabulate_entities',
@@ -8,9 +8,10 @@ from __future__ import annotations
 import functools
 import logging
 
-from typing import Final
+from typing import TYPE_CHECKING, Final
 
-import blessed
+if TYPE_CHECKING:
+    import blessed
 
 LOGGER: Final = logging.getLogger(__name__)
 
@@ -20,11 +21,14 @@ def get_terminal() -> blessed.Terminal:
     '''Return a blessed.Terminal instance.
 
        A function is used here so that we can defer initializing the
-       object until it's actually needed, which saves significant time
-       on startup because most things don't use it.
+       object (and importing blessed at all) until it's actually needed,
+       which saves significant time on startup because most things
+       don't use it.
 
        The return value is cached so that only a single instance is
        ever used.'''
+    import blessed
+
     LOGGER.debug('Initializing extended terminal interface.')
 
     return blessed.Terminal()
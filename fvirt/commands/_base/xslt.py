@@ -13,7 +13,7 @@ from typing import TYPE_CHECKING, Final, Self
 import click
 
 from .exitcode import ExitCode
-from .match import MatchCommand, get_match_or_entity
+from .match import MatchCommand, get_match_or_entity, require_match_or_entity
 from .objects import is_object_mixin
 from ...util.match import MatchArgument
 
@@ -54,6 +54,8 @@ class XSLTCommand(MatchCommand):
             from ...libvirt.runner import RunnerResult, run_entity_method, run_sub_entity_method
             from ...util.report import summary
 
+            require_match_or_entity(obj=self, ctx=ctx, match=match, entity=entity)
+
             xform = etree.XSLT(etree.parse(xslt))
 
             with state.hypervisor as hv:
@@ -63,8 +65,17 @@ class XSLTCommand(MatchCommand):
                     assert self.PARENT_ATTR is not None
 
                     parent_obj = self.get_parent_obj(ctx, hv, parent)
+                    entities = get_match_or_entity(
+                        hv=hv,
+                        obj=self,
+                        match=match,
+                        entity=entity,
+                        ctx=ctx,
+                        parent=parent_obj,
+                    )
+                    pool = state.get_pool(len(entities))
 
-                    futures: Sequence[concurrent.futures.Future] = [state.pool.submit(
+                    futures: Sequence[concurrent.futures.Future] = [pool.submit(
                         run_sub_entity_method,
                         uri=uri,
                         hvprop=self.PARENT_ATTR,
@@ -72,29 +83,30 @@ class XSLTCommand(MatchCommand):
                         method='apply_xslt',
                         ident=(parent_obj.name, e.name),
                         arguments=[xform],
-                    ) for e in get_match_or_entity(
+                        start_event_loop=False,
+                    ) for e in entities]
+                else:
+                    entities = get_match_or_entity(
                         hv=hv,
                         obj=self,
                         match=match,
                         entity=entity,
                         ctx=ctx,
-                    )]
-                else:
-                    futures = [state.pool.submit(
+                    )
+                    pool = state.get_pool(len(entities))
+
+                    futures = [pool.submit(
                         run_entity_method,
                         uri=uri,
                         hvprop=self.LOOKUP_ATTR,
                         method='apply_xslt',
                         ident=e.name,
                         arguments=[xform],
-                    ) for e in get_match_or_entity(
-                        hv=hv,
-                        obj=self,
-                        match=match,
-                        entity=entity,
-                        ctx=ctx,
-                    )]
+                        start_event_loop=False,
+                    ) for e in entities]
 
+            fail_fast = state.fail_fast
+            total = len(futures)
             success = 0
 
             for f in concurrent.futures.as_completed(futures):
@@ -111,7 +123,7 @@ class XSLTCommand(MatchCommand):
                         case RunnerResult(entity_found=False) as r if parent is None:
                             LOGGER.error(f'{ self.NAME } "{ r.ident }" disappeared before we could modify it.')
 
-                            if state.fail_fast:
+                            if fail_fast:
                                 break
                         case RunnerResult(entity_found=False) as r:
                             LOGGER.critical(f'{ self.PARENT_NAME } "{ r.ident[0] }" not found when trying to modify { self.NAME } "{ r.ident[1] }".')
@@ -119,7 +131,7 @@ class XSLTCommand(MatchCommand):
                         case RunnerResult(entity_found=True, sub_entity_found=False) as r:
                             LOGGER.warning(f'{ self.NAME } "{ r.ident[1] }" disappeared before we could modify it.')
 
-                            if state.fail_fast:
+                            if fail_fast:
                                 break
                         case RunnerResult(method_success=False) as r:
                             name = r.ident
@@ -129,7 +141,7 @@ class XSLTCommand(MatchCommand):
 
                             LOGGER.error(f'Failed to modify { self.NAME } "{ name }".')
 
-                            if state.fail_fast:
+                            if fail_fast:
                                 break
                         case RunnerResult(method_success=True) as r:
                             name = r.ident
@@ -144,17 +156,17 @@ class XSLTCommand(MatchCommand):
                 except Exception as e:
                     LOGGER.error('Encountered unexpected error while attempting to modify { self.NAME }', exc_info=e)
 
-                    if state.fail_fast:
+                    if fail_fast:
                         break
 
             click.echo(f'Finished modifying specified { self.NAME }s using XSLT document at { xslt }.')
             click.echo('')
             click.echo(summary(
-                total=len(futures),
+                total=total,
                 success=success,
             ))
 
-            if success != len(futures):
+            if success != total:
                 ctx.exit(ExitCode.OPERATION_FAILED)
 
         if self.HAS_PARENT:
@@ -5,34 +5,34 @@
 
 from __future__ import annotations
 
+import functools
+
 from typing import TYPE_CHECKING, Final, Self, Type
 
 from .._base.objects import DisplayProperty, ObjectMixin
-from .._base.tables import color_bool, color_optional
-from .._base.terminal import get_terminal
+from .._base.tables import color_bool, color_mapped, color_optional
 from ...libvirt.domain import Domain, DomainState
 
 if TYPE_CHECKING:
     from collections.abc import Mapping, Sequence
 
 
+_STATE_COLORS: Final = {
+    DomainState.RUNNING: 'bright_green_on_black',
+    DomainState.CRASHED: 'bright_red_on_black',
+    DomainState.BLOCKED: 'bright_red_on_black',
+    DomainState.NONE: 'bright_red_on_black',
+    DomainState.PAUSED: 'bright_yellow_on_black',
+    DomainState.PMSUSPEND: 'bright_blue_on_black',
+}
+
+
+@functools.cache
 def color_state(state: DomainState) -> str:
-    '''Apply colors to a domain state.'''
-    TERM = get_terminal()
-
-    match state:
-        case d if d in {DomainState.RUNNING}:
-            return TERM.bright_green_on_black(str(state))
-        case d if d in {DomainState.CRASHED, DomainState.BLOCKED, DomainState.NONE}:
-            return TERM.bright_red_on_black(str(state))
-        case d if d in {DomainState.PAUSED}:
-            return TERM.bright_yellow_on_black(str(state))
-        case d if d in {DomainState.PMSUSPEND}:
-            return TERM.bright_blue_on_black(str(state))
-        case _:
-            return str(state)
-
-    raise RuntimeError  # Needed because mypy thinks the above case statement is non-exhaustive.
+    '''Apply colors to a domain state.
+
+       Results are cached, as there are only a handful of states.'''
+    return color_mapped(state, _STATE_COLORS)
 
 
 def format_id(value: int) -> str:
@@ -5,32 +5,32 @@
 
 from __future__ import annotations
 
+import functools
+
 from typing import TYPE_CHECKING, Final, Self, Type
 
 from .._base.objects import DisplayProperty, ObjectMixin
-from .._base.tables import color_bool, color_optional
-from .._base.terminal import get_terminal
+from .._base.tables import color_bool, color_mapped, color_optional
 from ...libvirt.storage_pool import StoragePool, StoragePoolState
 
 if TYPE_CHECKING:
     from collections.abc import Mapping, Sequence
 
 
+_STATE_COLORS: Final = {
+    StoragePoolState.RUNNING: 'bright_green_on_black',
+    StoragePoolState.BUILDING: 'bright_yellow_on_black',
+    StoragePoolState.DEGRADED: 'bright_red_on_black',
+    StoragePoolState.INACCESSIBLE: 'bright_red_on_black',
+}
+
+
+@functools.cache
 def color_state(value: StoragePoolState) -> str:
-    '''Apply colors to a pool state.'''
-    TERM = get_terminal()
-
-    match value:
-        case s if s in {StoragePoolState.RUNNING}:
-            return TERM.bright_green_on_black(str(value))
-        case s if s in {StoragePoolState.BUILDING}:
-            return TERM.bright_yellow_on_black(str(value))
-        case s if s in {StoragePoolState.DEGRADED, StoragePoolState.INACCESSIBLE}:
-            return TERM.bright_red_on_black(str(value))
-        case _:
-            return str(value)
-
-    raise RuntimeError  # Needed because mypy thinks the above case statement is non-exhaustive.
+    '''Apply colors to a pool state.
+
+       Results are cached, as there are only a handful of states.'''
+    return color_mapped(value, _STATE_COLORS)
 
 
 _DISPLAY_PROPERTIES: Final = {
@@ -18,22 +18,80 @@
 
 from __future__ import annotations
 
-import libvirt
-
-from .domain import Domain, DomainState
-from .entity import LifecycleResult
-from .events import start_libvirt_event_thread
-from .exceptions import (EntityNotRunning, EntityRunning, FeatureNotSupported, FVirtException, InsufficientPrivileges, InvalidConfig,
-                         InvalidEntity, InvalidOperation, NotConnected, PlatformNotSupported, SubOperationFailed, TimedOut)
-from .hypervisor import Hypervisor
-from .storage_pool import StoragePool, StoragePoolState
-from .stream import Stream, StreamError
-from .types import OnOff, Timestamp, YesNo
-from .uri import DRIVER_INFO, LIBVIRT_DEFAULT_URI, LIBVIRT_URI, URI, Driver, Transport, URIAlias
-from .volume import Volume
-from ..version import VersionNumber
-
-API_VERSION = VersionNumber.from_libvirt_version(libvirt.getVersion())
+from importlib import import_module
+from typing import TYPE_CHECKING, Any, Final
+
+if TYPE_CHECKING:
+    from .domain import Domain, DomainState
+    from .entity import LifecycleResult
+    from .events import start_libvirt_event_thread
+    from .exceptions import (EntityNotRunning, EntityRunning, FeatureNotSupported, FVirtException, InsufficientPrivileges, InvalidConfig,
+                             InvalidEntity, InvalidOperation, NotConnected, PlatformNotSupported, SubOperationFailed, TimedOut)
+    from .hypervisor import Hypervisor
+    from .storage_pool import StoragePool, StoragePoolState
+    from .stream import Stream, StreamError
+    from .types import OnOff, Timestamp, YesNo
+    from .uri import DRIVER_INFO, LIBVIRT_DEFAULT_URI, LIBVIRT_URI, URI, Driver, Transport, URIAlias
+    from .volume import Volume
+    from ..version import VersionNumber
+
+    API_VERSION: VersionNumber
+
+# Most of these pull in the libvirt bindings, which are expensive to
+# import, so they are only loaded when first accessed. This lets things
+# like the URI handling be used without loading libvirt at all.
+_LAZY_ATTRS: Final = {
+    'Domain': 'domain',
+    'DomainState': 'domain',
+    'DRIVER_INFO': 'uri',
+    'Driver': 'uri',
+    'EntityNotRunning': 'exceptions',
+    'EntityRunning': 'exceptions',
+    'FeatureNotSupported': 'exceptions',
+    'FVirtException': 'exceptions',
+    'Hypervisor': 'hypervisor',
+    'InsufficientPrivileges': 'exceptions',
+    'InvalidConfig': 'exceptions',
+    'InvalidEntity': 'exceptions',
+    'InvalidOperation': 'exceptions',
+    'LIBVIRT_DEFAULT_URI': 'uri',
+    'LIBVIRT_URI': 'uri',
+    'LifecycleResult': 'entity',
+    'NotConnected': 'exceptions',
+    'OnOff': 'types',
+    'PlatformNotSupported': 'exceptions',
+    'start_libvirt_event_thread': 'events',
+    'StoragePool': 'storage_pool',
+    'StoragePoolState': 'storage_pool',
+    'Stream': 'stream',
+    'StreamError': 'stream',
+    'SubOperationFailed': 'exceptions',
+    'TimedOut': 'exceptions',
+    'Timestamp': 'types',
+    'Transport': 'uri',
+    'URI': 'uri',
+    'URIAlias': 'uri',
+    'Volume': 'volume',
+    'YesNo': 'types',
+}
+
+
+def __getattr__(name: str) -> Any:
+    if name == 'API_VERSION':
+        import libvirt
+
+        from ..version import VersionNumber
+
+        value: Any = VersionNumber.from_libvirt_version(libvirt.getVersion())
+    elif name in _LAZY_ATTRS:
+        value = getattr(import_module(f'.{ _LAZY_ATTRS[name] }', __name__), name)
+    else:
+        raise AttributeError(f'module { __name__!r} has no attribute { name!r}')
+
+    globals()[name] = value
+
+    return value
+
 
 __all__ = [
     'API_VERSION',
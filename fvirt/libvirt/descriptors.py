@@ -62,8 +62,10 @@ class ReadDescriptor(Generic[T], ABC):
         if instance is None:
             return self  # type: ignore
 
-        if hasattr(instance, '_check_valid'):
-            instance._check_valid()
+        check_valid = getattr(instance, '_check_valid', None)
+
+        if check_valid is not None:
+            check_valid()
 
         try:
             v = self._get_value(instance)
@@ -112,11 +114,11 @@ class WriteDescriptor(Generic[T]):
 
     @final
     def __set__(self: Self, instance: Entity, value: T) -> None:
-        if hasattr(instance, '_check_valid'):
-            instance._check_valid()
-
-        self._validator(value, instance)
-        self._set_value(value, instance)
+        # Entering the entity context lets validators that check other
+        # config values share a single config fetch with the write.
+        with instance:
+            self._validator(value, instance)
+            self._set_value(value, instance)
 
     @abstractmethod
     def _set_value(self: Self, value: T, instance: Entity, /) -> None:
@@ -232,37 +234,43 @@ class ConfigProperty(ReadDescriptor[T]):
         self._units_to_bytes = units_to_bytes
         self._collection = collection
 
+        # Pick the value conversion once here instead of checking
+        # units_to_bytes on every read.
+        self._handle_value: Callable[[Any], Any] = self._handle_units if units_to_bytes else self._handle_plain
+
         super().__init__(doc=doc, type=type, fallback=fallback, **kwargs)
 
     def __repr__(self: Self) -> str:
         return f'<ConfigProperty: path={ self._path }, fallback={ self._fallback }>'
 
     def _get_value(self: Self, instance: Entity, /) -> Any:
-        result = self._xpath(instance.config)
-
-        if result is None or result == []:
-            raise AttributeError(f'{ repr(instance) }:{ repr(self) }')
+        result = self._xpath(instance._read_config())
 
         if isinstance(result, list):
-            if self._collection:
+            if not result:
+                raise AttributeError(f'{ repr(instance) }:{ repr(self) }')
+            elif self._collection:
                 return [self._handle_value(x) for x in result]
             else:
                 return self._handle_value(result[0])
+        elif result is None:
+            raise AttributeError(f'{ repr(instance) }:{ repr(self) }')
         else:
             return self._handle_value(result)
 
-    def _handle_value(self: Self, v: Any, /) -> Any:
-        if isinstance(v, bool) or isinstance(v, str) or isinstance(v, float) or isinstance(v, bytes) or isinstance(v, tuple):
-            ret = v
-        elif self._units_to_bytes:
-            unit = v.get('unit', default='bytes')
-            value = int(str(v.text))
+    @staticmethod
+    def _handle_plain(v: Any, /) -> Any:
+        if isinstance(v, (bool, str, float, bytes, tuple)):
+            return v
 
-            ret = unit_to_bytes(value, unit)
-        else:
-            ret = v.text
+        return v.text
 
-        return ret
+    @staticmethod
+    def _handle_units(v: Any, /) -> Any:
+        if isinstance(v, (bool, str, float, bytes, tuple)):
+            return v
+
+        return unit_to_bytes(int(str(v.text)), v.get('unit', default='bytes'))
 
 
 class ConfigElementProperty(ConfigProperty[T], WriteDescriptor[T]):
@@ -292,7 +300,7 @@ class ConfigElementProperty(ConfigProperty[T], WriteDescriptor[T]):
         return f'<ConfigElementProperty: path={ self._path }, fallback={ self._fallback }>'
 
     def _set_value(self: Self, value: T, instance: Entity, /) -> None:
-        instance.update_config_element(self._path, str(value), reset_units=self._units_to_bytes)
+        instance._set_config_element(self._path, str(value), self._units_to_bytes)
 
 
 class ConfigAttributeProperty(ReadDescriptor[T], WriteDescriptor[T]):
@@ -309,6 +317,7 @@ class ConfigAttributeProperty(ReadDescriptor[T], WriteDescriptor[T]):
         **kwargs: Any,
     ) -> None:
         self._path = path
+        self._xpath = etree.XPath(path, smart_strings=False)
         self._attr = attr
 
         super().__init__(
@@ -323,12 +332,17 @@ class ConfigAttributeProperty(ReadDescriptor[T], WriteDescriptor[T]):
         return f'<ConfigAttributeProperty: path={ self._path }, attr={ self._attr }, fallback={ self._fallback }>'
 
     def _get_value(self: Self, instance: Entity, /) -> Any:
-        e = instance.config.find(self._path)
+        result = cast(list[etree._Element], self._xpath(instance._read_config()))
 
-        if e is None:
-            return None
+        if not result:
+            raise AttributeError(f'{ repr(instance) }:{ repr(self) }')
+
+        value = result[0].get(self._attr, default=None)
+
+        if value is None:
+            raise AttributeError(f'{ repr(instance) }:{ repr(self) }')
 
-        return e.get(self._attr, default=None)
+        return value
 
     def _set_value(self: Self, value: T, instance: Entity, /) -> None:
-        instance.update_config_attribute(self._path, self._attr, str(value))
+        instance._set_config_attribute(self._path, self._attr, str(value))
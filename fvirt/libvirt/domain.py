@@ -6,18 +6,21 @@
 from __future__ import annotations
 
 import logging
+import threading
 
 from enum import CONTINUOUS, UNIQUE, Enum, verify
-from time import sleep
+from time import monotonic
 from typing import TYPE_CHECKING, Any, ClassVar, Final, Literal, Self, cast, overload
 from uuid import UUID
 
 import libvirt
 
+from lxml import etree
+
 from .descriptors import ConfigAttributeProperty, ConfigElementProperty, MethodProperty
 from .entity import LifecycleResult, RunnableEntity
 from .entity_access import BaseEntityAccess, EntityAccess, EntityMap, NameMap, UUIDMap
-from .exceptions import EntityNotRunning, InvalidOperation
+from .exceptions import EntityNotRunning, FVirtException, InvalidOperation
 from .stream import Stream
 from ..util.match import MatchAlias
 
@@ -28,14 +31,12 @@ if TYPE_CHECKING:
     from .models.domain import DomainInfo
 
 LOGGER: Final = logging.getLogger(__name__)
+_TITLE_XPATH: Final = etree.XPath('/domain/title/text()[1]', smart_strings=False)
 
 
 def _non_negative_integer(value: int, _instance: Any) -> None:
-    if not isinstance(value, int):
+    if not isinstance(value, int) or value < 1:
         raise ValueError(f'{ value } is not a positive integer.')
-    else:
-        if value < 1:
-            raise ValueError(f'{ value } is not a positive integer.')
 
 
 def _currentCPUs_validator(value: int, instance: Domain) -> None:
@@ -91,6 +92,8 @@ class Domain(RunnableEntity):
        This is a wrapper around a libvirt.virDomain instance. It lacks
        some of the functionality provided by that class, but wraps most
        of the useful parts in a nicer, more Pythonic interface.'''
+    __slots__ = ()
+
     MATCH_ALIASES: ClassVar = {
         'arch': MatchAlias(property='os_arch', desc='Match on the architecture of the domain.'),
         'autostart': MatchAlias(property='autostart', desc='Match on whether the domain is set to autostart or not.'),
@@ -103,6 +106,10 @@ class Domain(RunnableEntity):
         'state': MatchAlias(property='state', desc='Match on the current state of the domain.'),
     }
 
+    _format_properties: ClassVar[frozenset[str]] = RunnableEntity._format_properties | {
+        'id',
+    }
+
     genid: ConfigElementProperty[UUID] = ConfigElementProperty(
         doc='The generation ID of the domain.',
         path='./genid',
@@ -141,7 +148,7 @@ class Domain(RunnableEntity):
         path='./vcpu',
         attr='current',
         typ=int,
-        fallback='maxCPUs',
+        fallback='max_cpus',
         validator=_currentCPUs_validator,
     )
     max_memory: ConfigElementProperty[int] = ConfigElementProperty(
@@ -209,12 +216,6 @@ class Domain(RunnableEntity):
     def _wrapped_class(self: Self) -> Any:
         return libvirt.virDomain
 
-    @property
-    def _format_properties(self: Self) -> set[str]:
-        return super()._format_properties | {
-            'id',
-        }
-
     @property
     def _define_method(self: Self) -> str:
         return 'define_domain'
@@ -223,7 +224,7 @@ class Domain(RunnableEntity):
     def _config_flags(self: Self) -> int:
         flags = 0
 
-        if not self._hv.read_only:
+        if not self._read_only:
             flags |= libvirt.VIR_DOMAIN_XML_SECURE
 
         return flags
@@ -253,13 +254,14 @@ class Domain(RunnableEntity):
            This is an optional bit of metadata describing the domain.'''
         self._check_valid()
 
-        match self.config.xpath('/domain/title/text()[1]', smart_strings=False):
-            case []:
-                return ''
-            case [str() as ret]:
-                return ret
-            case _:
-                raise RuntimeError
+        result = _TITLE_XPATH(self._read_config())
+
+        if not result:
+            return ''
+        elif isinstance(result, list) and len(result) == 1 and isinstance(result[0], str):
+            return result[0]
+        else:
+            raise RuntimeError
 
     def reset(self: Self) -> Literal[LifecycleResult.SUCCESS]:
         '''Attempt to reset the domain.
@@ -301,7 +303,10 @@ class Domain(RunnableEntity):
            method). A timeout of less than 0 indicates that fvirt should
            use an arbitrary large timeout with longer polling periods.
 
-           The timeout is polled roughly once per second using time.sleep().
+           If the libvirt event loop is running, completion of the
+           shutdown is detected through a lifecycle event callback as soon
+           as it happens. Otherwise, the state of the domain is polled
+           roughly once per second.
 
            To forcibly shutdown ('destroy' in libvirt terms) the domain,
            use the destroy() method instead.
@@ -333,24 +338,47 @@ class Domain(RunnableEntity):
         if not self.persistent:
             mark_invalid = True
 
-        LOGGER.info(f'Beginning shutdown of domain: {repr(self)}')
-        self._entity.shutdown()
+        stopped = threading.Event()
+        callback_id = None
+
+        if tmcount > 0:
+            callback_id = self._watch_for_stop(stopped)
 
-        while tmcount > 0:
-            # The cast below is needed to convince type checkers that
+        try:
+            LOGGER.info(f'Beginning shutdown of domain: {repr(self)}')
+            self._entity.shutdown()
+            self._invalidate_config()
+            self._hv._invalidate_lists()
+
+            # The casts below are needed to convince type checkers that
             # self.running may not be True anymore at this point, since
             # they do not know that self._entity.shutdown() may result in
             # it's value changing.
-            if not cast(bool, self.running):
-                if mark_invalid:
-                    self._valid = False
+            if tmcount > 0:
+                deadline = monotonic() + tmcount
+
+                while True:
+                    running = cast(bool, self.running)
+
+                    if not running:
+                        if mark_invalid:
+                            self._valid = False
+
+                        break
 
-                break
+                    remaining = deadline - monotonic()
 
-            tmcount -= interval
-            sleep(interval)
+                    if remaining <= 0:
+                        break
 
-        if cast(bool, self.running):
+                    stopped.wait(min(interval, remaining))
+            else:
+                running = cast(bool, self.running)
+        finally:
+            if callback_id is not None:
+                self._unwatch(callback_id)
+
+        if running:
             if force:
                 LOGGER.warning(f'Failed to shut down domain: {repr(self)}')
 
@@ -371,6 +399,40 @@ class Domain(RunnableEntity):
             LOGGER.info(f'Finished shutdown of domain: {repr(self)}')
             return LifecycleResult.SUCCESS
 
+    def _watch_for_stop(self: Self, stopped: threading.Event, /) -> int | None:
+        '''Arrange for `stopped` to be set when the domain stops.
+
+           This relies on the libvirt event loop running. If the
+           lifecycle callback cannot be registered, None is returned and
+           the caller is expected to fall back to polling.'''
+        connection = self._hv._connection
+
+        if connection is None:
+            return None
+
+        uuid = self._entity.UUIDString()
+        events = (libvirt.VIR_DOMAIN_EVENT_STOPPED, libvirt.VIR_DOMAIN_EVENT_UNDEFINED)
+
+        def cb(_conn: Any, dom: Any, event: int, _detail: int, _opaque: None) -> None:
+            if event in events and dom.UUIDString() == uuid:
+                stopped.set()
+
+        try:
+            return cast(int, connection.domainEventRegisterAny(None, libvirt.VIR_DOMAIN_EVENT_ID_LIFECYCLE, cb, None))
+        except FVirtException:
+            LOGGER.debug(f'Unable to register lifecycle callback for domain, falling back to polling: {repr(self)}')
+            return None
+
+    def _unwatch(self: Self, callback_id: int, /) -> None:
+        '''Remove a lifecycle callback registered by _watch_for_stop().'''
+        connection = self._hv._connection
+
+        if connection is not None:
+            try:
+                connection.domainEventDeregisterAny(callback_id)
+            except FVirtException:
+                pass
+
     def managed_save(self: Self, /, *, idempotent: bool = True) -> LifecycleResult:
         '''Suspend the domain and save it's state to disk.
 
@@ -392,6 +454,8 @@ class Domain(RunnableEntity):
 
         LOGGER.info(f'Saving state of domain: {repr(self)}')
         self._entity.managedSave(flags=0)
+        self._invalidate_config()
+        self._hv._invalidate_lists()
 
         return LifecycleResult.SUCCESS
 
@@ -425,45 +489,39 @@ class Domain(RunnableEntity):
 
 class Domains(BaseEntityAccess[Domain]):
     '''Domain access mixin for Entity access protocol.'''
-    @property
-    def _count_funcs(self: Self) -> Iterable[str]:
-        return {'numOfDomains', 'numOfDefinedDomains'}
-
-    @property
-    def _list_func(self: Self) -> str:
-        return 'listAllDomains'
+    __slots__ = ()
 
-    @property
-    def _entity_class(self: Self) -> type:
-        return Domain
+    _count_funcs: ClassVar[Iterable[str]] = ('numOfDomains', 'numOfDefinedDomains')
+    _list_func: ClassVar[str] = 'listAllDomains'
+    _entity_class: ClassVar[type] = Domain
 
 
 class DomainsByName(NameMap[Domain], Domains):
     '''Immutabkle mapping returning domains on a Hypervisor based on their names.'''
-    @property
-    def _lookup_func(self: Self) -> str:
-        return 'lookupByName'
+    __slots__ = ()
+
+    _lookup_func: ClassVar[str] = 'lookupByName'
 
 
 class DomainsByUUID(UUIDMap[Domain], Domains):
     '''Immutabkle mapping returning domains on a Hypervisor based on their UUIDs.'''
-    @property
-    def _lookup_func(self: Self) -> str:
-        return 'lookupByUUIDString'
+    __slots__ = ()
+
+    _lookup_func: ClassVar[str] = 'lookupByUUIDString'
 
 
 class DomainsByID(EntityMap[Domain], Domains):
     '''Immutabkle mapping returning running domains on a Hypervisor based on their IDs.'''
-    @property
-    def _count_funcs(self: Self) -> Iterable[str]:
-        return {'numOfDomains'}
+    __slots__ = ()
 
-    @property
-    def _lookup_func(self: Self) -> str:
-        return 'lookupByID'
+    _count_funcs: ClassVar[Iterable[str]] = ('numOfDomains',)
+    _list_flags: ClassVar[int] = libvirt.VIR_CONNECT_LIST_DOMAINS_ACTIVE
+    _lookup_func: ClassVar[str] = 'lookupByID'
 
     @staticmethod
     def _filter_entities(entities: Iterable) -> Iterable:
+        # Some drivers list a domain with ID 0 (such as Xen's Dom0)
+        # as active, but it cannot be looked up by ID.
         return iter(x for x in entities if x.ID() > 0)
 
     def _get_key(self: Self, entity: Any) -> int:
@@ -484,6 +542,12 @@ class DomainAccess(EntityAccess[Domain], Domains):
 
        DomainAccess instances are also sized, with len(instance) returning
        the total number of domains on the Hypervisor.'''
+    __slots__ = (
+        '__by_name',
+        '__by_uuid',
+        '__by_id',
+    )
+
     def __init__(self: Self, parent: Hypervisor) -> None:
         self.__by_name = DomainsByName(parent)
         self.__by_uuid = DomainsByUUID(parent)
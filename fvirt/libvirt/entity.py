@@ -5,10 +5,13 @@
 
 from __future__ import annotations
 
+import copy
 import enum
+import functools
 import logging
 
 from abc import ABC, abstractmethod
+from contextlib import contextmanager
 from typing import TYPE_CHECKING, Any, ClassVar, Final, Literal, Self, TypeVar, cast, final
 from uuid import UUID
 
@@ -20,7 +23,7 @@ from .hypervisor import Hypervisor
 from ..templates import get_environment
 
 if TYPE_CHECKING:
-    from collections.abc import Mapping
+    from collections.abc import Iterator, Mapping
 
     from pydantic import BaseModel
 
@@ -30,6 +33,12 @@ T = TypeVar('T')
 LOGGER: Final = logging.getLogger(__name__)
 
 
+@functools.lru_cache(maxsize=64)
+def _compile_path(path: str, /) -> etree.XPath:
+    '''Compile an XPath expression used to look up configuration elements.'''
+    return etree.XPath(path, smart_strings=False)
+
+
 class LifecycleResult(enum.Enum):
     '''An enumeration indicating the result of an entity lifecycle operation.
 
@@ -61,17 +70,37 @@ class Entity(ABC):
        an entity’s context will ensure that the Hypervisor instance
        it is tied to is connected, and that the entity itself is valid.
 
+       While inside an entity’s context, the parsed configuration of
+       the entity is cached, so reading multiple configuration
+       properties only fetches and parses the configuration once. The
+       cache is discarded when the outermost context is exited, and
+       whenever the entity is redefined or changes state through the
+       same instance. Changes made by other clients while inside the
+       context will not be seen until the context is exited.
+
        The MATCH_ALIASES class variable should be updated by child
        classes to reflect their actual list of match aliases.'''
     __slots__ = [
+        '_config_cache',
+        '_context_depth',
+        '_edit_tree',
         '_entity',
         '_hv',
         '_parent',
+        '_read_only',
         '_valid',
     ]
 
     MATCH_ALIASES: ClassVar[Mapping[str, MatchAlias]] = dict()
 
+    # Properties usable as named arguments in format() specifiers.
+    # Child classes should extend this to include any additional
+    # properties they want to be supported.
+    _format_properties: ClassVar[frozenset[str]] = frozenset({'name', 'uuid'})
+
+    # Whether or not the Entity should be marked invalid when undefined.
+    _mark_invalid_on_undefine: ClassVar[bool] = True
+
     def __init__(self: Self, entity: Any, parent: Hypervisor | Entity | None = None, /) -> None:
         match parent:
             case None:
@@ -99,21 +128,19 @@ class Entity(ABC):
                 raise TypeError('Parent must be Hypervisor or Entity instance.')
 
         self._hv.open()
+        self._read_only = self._hv.read_only
         self._valid = True
+        self._config_cache: etree._ElementTree | None = None
+        self._context_depth = 0
+        self._edit_tree: etree._ElementTree | None = None
 
     def __del__(self: Self) -> None:
         self._hv.close()
 
     def __format__(self: Self, format_spec: str) -> str:
-        fmt_args: dict[str, Any] = dict()
-
-        for prop in self._format_properties:
-            prop_value = getattr(self, prop, None)
-
-            if prop_value is None:
-                continue
-            else:
-                fmt_args[prop] = prop_value
+        fmt_args: dict[str, Any] = {
+            prop: value for prop in self._format_properties if (value := getattr(self, prop, None)) is not None
+        }
 
         return format_spec.format(**fmt_args)
 
@@ -131,10 +158,22 @@ class Entity(ABC):
 
     def __enter__(self: Self) -> Self:
         self._check_valid()
+        self._context_depth += 1
         return self
 
     def __exit__(self: Self, *args: Any, **kwargs: Any) -> None:
-        pass
+        self._context_depth -= 1
+
+        if self._context_depth <= 0:
+            self._context_depth = 0
+            self._config_cache = None
+
+    def _invalidate_config(self: Self) -> None:
+        '''Discard any cached configuration for the entity.
+
+           Methods that redefine the entity or change it’s state should
+           call this so that later reads see the updated configuration.'''
+        self._config_cache = None
 
     def _check_valid(self: Self) -> None:
         '''Check that the instance is still valid.
@@ -143,7 +182,7 @@ class Entity(ABC):
            function that should not be run on invalid instances. It
            will handle raising the correct error if the instance is
            not valid.'''
-        if not self.valid:
+        if not self._valid:
             raise InvalidEntity
 
         if not self._hv.connected:
@@ -193,21 +232,6 @@ class Entity(ABC):
            appropriately.'''
         return {'name', 'uuid'}
 
-    @property
-    def _format_properties(self: Self) -> set[str]:
-        '''A set of properties usable with format().
-
-           Any properties listed here can be used in a format specifier
-           as named arguments when calling format() on an Entity
-           instance. Child classes should override this to include any
-           additional properties they want to be supported.'''
-        return {'name', 'uuid'}
-
-    @property
-    def _mark_invalid_on_undefine(self: Self) -> bool:
-        '''Whether or not the Entity should be marked invalid when undefined.'''
-        return True  # pragma: nocover
-
     @final
     @property
     def valid(self: Self) -> bool:
@@ -235,12 +259,12 @@ class Entity(ABC):
         '''The UUID of the entity, or None if it has no UUID.'''
         self._check_valid()
 
-        get_uuid = getattr(self._entity, 'UUIDString', None)
+        get_uuid = getattr(self._entity, 'UUID', None)
 
         if get_uuid is None:
             return None
 
-        return UUID(get_uuid())
+        return UUID(bytes=get_uuid())
 
     @property
     def config_raw(self: Self) -> str:
@@ -258,21 +282,25 @@ class Entity(ABC):
     @config_raw.setter
     def config_raw(self: Self, config: str) -> None:
         '''Recreate the entity with the specified raw XML configuration.'''
-        if not self._define_method:
+        method = self._define_method
+
+        if not method:
             raise ValueError('No method specified to redefine entity.')
 
-        if self._hv.read_only:
+        if self._read_only:
             raise InsufficientPrivileges
 
         LOGGER.debug(f'Updating config for entity: {repr(self)}')
 
-        define = getattr(self._define_target, self._define_method, None)
+        define = getattr(self._define_target, method, None)
 
         if define is None:
-            raise RuntimeError(f'Could not find define method { self._define_method } on target instance.')
+            raise RuntimeError(f'Could not find define method { method } on target instance.')
 
         self._entity = define(config)._entity
 
+        self._invalidate_config()
+        self._hv._invalidate_lists()
         self._valid = True
 
     @property
@@ -282,7 +310,13 @@ class Entity(ABC):
            Writing to this property will attempt to redefine the Entity
            with the specified config.
 
-           For the raw XML as a string, use the rawConfig property.'''
+           For the raw XML as a string, use the rawConfig property.
+
+           Each access returns a new tree, so it is safe to modify the
+           returned value.'''
+        if self._config_cache is not None:
+            return copy.deepcopy(self._config_cache)
+
         return etree.ElementTree(etree.fromstring(self.config_raw))
 
     @config.setter
@@ -290,6 +324,59 @@ class Entity(ABC):
         '''Recreate the Entity with the specified XML configuration.'''
         self.config_raw = etree.tostring(config, encoding='unicode')
 
+    def _read_config(self: Self) -> etree._ElementTree:
+        '''Get the parsed configuration for read-only use.
+
+           Inside the entity’s context, this reuses a cached copy of
+           the configuration instead of fetching and parsing it again.
+           The returned tree must not be modified.
+
+           While an edit() block is active, this returns the pending
+           configuration, so reads reflect the changes made so far.'''
+        if self._edit_tree is not None:
+            return self._edit_tree
+
+        if self._config_cache is not None:
+            return self._config_cache
+
+        config = etree.ElementTree(etree.fromstring(self.config_raw))
+
+        if self._context_depth > 0:
+            self._config_cache = config
+
+        return config
+
+    @contextmanager
+    def edit(self: Self) -> Iterator[etree._ElementTree]:
+        '''Batch multiple configuration changes into one redefinition.
+
+           This is a context manager that yields the configuration of
+           the entity. Changes made to the yielded tree, as well as
+           changes made through update_config_element(),
+           update_config_attribute(), or writable configuration
+           properties of the entity, are applied with a single
+           redefinition of the entity when the block exits.
+
+           If the block exits with an exception, none of the changes
+           are applied.
+
+           Nested calls reuse the outermost pending configuration.'''
+        self._check_valid()
+
+        if self._edit_tree is not None:
+            yield self._edit_tree
+            return
+
+        config = self.config
+        self._edit_tree = config
+
+        try:
+            yield config
+        finally:
+            self._edit_tree = None
+
+        self.config = config
+
     def update_config_element(self: Self, /, path: str, text: str, *, reset_units: bool = False) -> bool:
         '''Update the element at path in config to have a value of text.
 
@@ -308,18 +395,33 @@ class Entity(ABC):
 
         self._check_valid()
 
-        config = self.config
-        element = config.find(path)
+        return self._set_config_element(path, text, reset_units)
+
+    def _set_config_element(self: Self, path: str, text: str, reset_units: bool, /) -> bool:
+        '''Internal implementation of update_config_element().
+
+           This skips argument and validity checking, callers are
+           expected to have already done so.'''
+        config = self._edit_tree
+
+        if config is None:
+            config = self.config
+
+        elements = cast(list[etree._Element], _compile_path(path)(config))
 
-        if not element:
+        if not elements:
             return False
 
+        element = elements[0]
+
         element.text = text
 
         if reset_units:
             element.set('units', 'bytes')
 
-        self.config = config
+        if self._edit_tree is None:
+            self.config = config
+
         return True
 
     def update_config_attribute(self: Self, /, path: str, attrib: str, value: str) -> bool:
@@ -340,15 +442,30 @@ class Entity(ABC):
 
         self._check_valid()
 
-        config = self.config
-        element = config.find(path)
+        return self._set_config_attribute(path, attrib, value)
+
+    def _set_config_attribute(self: Self, path: str, attrib: str, value: str, /) -> bool:
+        '''Internal implementation of update_config_attribute().
+
+           This skips argument and validity checking, callers are
+           expected to have already done so.'''
+        config = self._edit_tree
+
+        if config is None:
+            config = self.config
 
-        if not element:
+        elements = cast(list[etree._Element], _compile_path(path)(config))
+
+        if not elements:
             return False
 
+        element = elements[0]
+
         element.set(attrib, value)
 
-        self.config = config
+        if self._edit_tree is None:
+            self.config = config
+
         return True
 
     def undefine(self: Self, /, *, idempotent: bool = True) -> LifecycleResult:
@@ -375,6 +492,8 @@ class Entity(ABC):
 
         LOGGER.info(f'Undefining entity: {repr(self)}')
         self._entity.undefine()
+        self._invalidate_config()
+        self._hv._invalidate_lists()
 
         if mark_invalid:
             self._valid = False
@@ -389,7 +508,7 @@ class Entity(ABC):
 
            This handles reading the config, applying the transformation,
            and then saving the config, all as one operation.'''
-        self.config = xslt(self.config)
+        self.config = xslt(self._read_config())
 
     @final
     @classmethod
@@ -463,6 +582,8 @@ class Entity(ABC):
 
 class RunnableEntity(Entity):
     '''Base for entities that may be activated and inactivated.'''
+    __slots__ = ()
+
     running: MethodProperty[bool] = MethodProperty(
         doc='Whether the entity is running or not.',
         type=bool,
@@ -482,15 +603,13 @@ class RunnableEntity(Entity):
            Must be overridden by child classes.'''
         return NotImplemented
 
-    @property
-    def _format_properties(self: Self) -> set[str]:
-        return super()._format_properties | {
-            'running',
-            'persistent',
-        }
+    _format_properties: ClassVar[frozenset[str]] = Entity._format_properties | {
+        'running',
+        'persistent',
+    }
 
     @property
-    def _mark_invalid_on_undefine(self: Self) -> bool:
+    def _mark_invalid_on_undefine(self: Self) -> bool:  # type: ignore[override]
         return not self.running
 
     @Entity.config_raw.getter  # type: ignore
@@ -550,7 +669,7 @@ class RunnableEntity(Entity):
         self._check_valid()
 
         if hasattr(self._entity, 'setAutostart'):
-            if self._hv.read_only:
+            if self._read_only:
                 raise InsufficientPrivileges
 
             LOGGER.info(f'Setting autostart state to {value} for entity: {repr(self)}')
@@ -580,6 +699,8 @@ class RunnableEntity(Entity):
 
         LOGGER.info(f'Starting entity: {repr(self)}')
         self._entity.create()
+        self._invalidate_config()
+        self._hv._invalidate_lists()
 
         return LifecycleResult.SUCCESS
 
@@ -611,6 +732,8 @@ class RunnableEntity(Entity):
 
         LOGGER.info(f'Destroying entity: {repr(self)}')
         self._entity.destroy()
+        self._invalidate_config()
+        self._hv._invalidate_lists()
 
         if mark_invalid:
             self._valid = False
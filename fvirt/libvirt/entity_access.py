@@ -7,12 +7,12 @@ from __future__ import annotations
 
 from abc import ABC, abstractmethod
 from collections.abc import Iterable, Iterator, Mapping, Sized
-from typing import TYPE_CHECKING, Any, Generic, Self, TypeVar, cast, final
+from typing import TYPE_CHECKING, Any, ClassVar, Generic, Self, TypeVar, cast, final
 from uuid import UUID
 
 from .entity import Entity
 from .exceptions import FVirtException
-from ..util.match import MatchArgument
+from ..util.match import MatchArgument, matcher
 
 if TYPE_CHECKING:
     from .hypervisor import Hypervisor
@@ -21,7 +21,33 @@ T = TypeVar('T', bound=Entity)
 
 
 class BaseEntityAccess(ABC, Sized, Generic[T]):
-    '''Abstract base class for entity access protocols.'''
+    '''Abstract base class for entity access protocols.
+
+       Child classes must define the following class attributes:
+
+       `_count_funcs` is an iterable of methods to call to get counts
+       of the entities. This usually should be the pair of `numOf` and
+       `numOfDefined` methods corresponding to the type of entity.
+       Entities on a Hypervisor are counted from the (possibly cached)
+       entity listing instead, so this is only used when the parent is
+       another entity.
+
+       `_list_func` is the name of the function used to list all of
+       the entities.
+
+       `_list_flags` may optionally be overridden to pass flags to
+       `_list_func`, so that libvirt can filter the listing itself.
+
+       `_entity_class` is the class used to encapsulate the entities.'''
+    __slots__ = (
+        '_parent',
+    )
+
+    _count_funcs: ClassVar[Iterable[str]]
+    _list_func: ClassVar[str]
+    _list_flags: ClassVar[int] = 0
+    _entity_class: ClassVar[type]
+
     def __init__(self: Self, parent: Hypervisor | Entity, /) -> None:
         self._parent = parent
 
@@ -29,6 +55,9 @@ class BaseEntityAccess(ABC, Sized, Generic[T]):
         return f'<fvirt.libvirt.{ type(self).__name__ }: { repr(self._parent) }>'
 
     def __len__(self: Self) -> int:
+        if hasattr(self._parent, '_list_entities'):
+            return sum(1 for _ in self._filter_entities(self._list_entities()))
+
         total = 0
 
         with self._parent:
@@ -39,6 +68,21 @@ class BaseEntityAccess(ABC, Sized, Generic[T]):
 
         return total
 
+    @final
+    def _list_entities(self: Self) -> Iterable[Any]:
+        '''List the underlying libvirt objects for the entities.
+
+           Listings from a Hypervisor are cached briefly by the
+           Hypervisor itself, so repeated iteration does not need a
+           new call to libvirt each time.'''
+        if hasattr(self._parent, '_list_entities'):
+            return cast(Iterable[Any], self._parent._list_entities(self._list_func, self._list_flags))
+
+        with self._parent:
+            link = self._get_parent_link()
+
+            return cast(Iterable[Any], getattr(link, self._list_func)(self._list_flags) or ())
+
     @final
     def _get_parent_link(self: Self) -> Any:
         if hasattr(self._parent, '_connection'):
@@ -55,36 +99,19 @@ class BaseEntityAccess(ABC, Sized, Generic[T]):
         '''Used to filter entities prior to wrapping them in _entity_class.'''
         return entities
 
-    @property
-    @abstractmethod
-    def _count_funcs(self: Self) -> Iterable[str]:
-        '''An iterable of methods to call to get counts of the entities.
-
-           This usually should be the pair of `numOf` and `numOfDefined`
-           methods corresponding to the type of entity.'''
 
-    @property
-    @abstractmethod
-    def _list_func(self: Self) -> str:
-        '''The name of the function used to list all of the entities.'''
+class EntityMap(BaseEntityAccess[T], Mapping):
+    '''ABC for mappings of entities on a hypervisor.
 
-    @property
-    @abstractmethod
-    def _entity_class(self: Self) -> type[T]:
-        '''The class used to encapsulate the entities.'''
+       Child classes must define a `_lookup_func` class attribute naming
+       the lookup method called on the parent's libvirt object to find
+       an entity.'''
+    __slots__ = ()
 
+    _lookup_func: ClassVar[str]
 
-class EntityMap(BaseEntityAccess[T], Mapping):
-    '''ABC for mappings of entities on a hypervisor.'''
     def __iter__(self: Self) -> Iterator[str]:
-        with self._parent:
-            link = self._get_parent_link()
-
-            match getattr(link, self._list_func)():
-                case None:
-                    return iter([])
-                case entities:
-                    return iter(self._get_key(x) for x in self._filter_entities(entities))
+        return iter(self._get_key(x) for x in self._filter_entities(self._list_entities()))
 
     def __getitem__(self: Self, key: Any) -> T:
         key = self._coerce_key(key)
@@ -93,14 +120,29 @@ class EntityMap(BaseEntityAccess[T], Mapping):
             link = self._get_parent_link()
 
             try:
-                match getattr(link, self._lookup_func)(key):
-                    case None:
-                        raise KeyError(key)
-                    case entity:
-                        return self._entity_class(entity, self._parent)
+                entity = getattr(link, self._lookup_func)(key)
             except FVirtException:
                 raise KeyError(key)
 
+            if entity is None:
+                raise KeyError(key)
+
+            return cast(T, self._entity_class(entity, self._parent))
+
+    def __contains__(self: Self, key: Any) -> bool:
+        try:
+            key = self._coerce_key(key)
+        except KeyError:
+            return False
+
+        with self._parent:
+            link = self._get_parent_link()
+
+            try:
+                return getattr(link, self._lookup_func)(key) is not None
+            except FVirtException:
+                return False
+
     @abstractmethod
     def _get_key(self: Self, entity: Any) -> Any:
         '''Get the key for a given entity.'''
@@ -109,14 +151,11 @@ class EntityMap(BaseEntityAccess[T], Mapping):
     def _coerce_key(self: Self, key: Any) -> Any:
         '''Method used to coerce keys to the type expected by the lookup method.'''
 
-    @property
-    @abstractmethod
-    def _lookup_func(self: Self) -> str:
-        '''Name of the lookup method called on virConnect to find an entity.'''
-
 
 class NameMap(EntityMap[T]):
     '''Mapping access to entities by name.'''
+    __slots__ = ()
+
     def _get_key(self: Self, entity: Any) -> str:
         return cast(str, entity.name())
 
@@ -140,21 +179,20 @@ class UUIDMap(EntityMap[T]):
        converted to a UUID object, a ValueError will be raised.
 
        When iterating keys, only uuid.UUID objects will be returned.'''
+    __slots__ = ()
+
     def _get_key(self: Self, entity: Any) -> UUID:
-        return UUID(entity.UUIDString())
+        return UUID(bytes=entity.UUID())
 
     def _coerce_key(self: Self, key: Any) -> str:
-        match key:
-            case str():
-                pass
-            case bytes():
-                key = str(UUID(bytes=key))
-            case UUID():
-                key = str(key)
-            case _:
-                raise KeyError(key)
-
-        return cast(str, key)
+        if isinstance(key, str):
+            return key
+        elif isinstance(key, bytes):
+            return str(UUID(bytes=key))
+        elif isinstance(key, UUID):
+            return str(key)
+        else:
+            raise KeyError(key)
 
 
 class EntityAccess(BaseEntityAccess[T], Iterable):
@@ -170,15 +208,10 @@ class EntityAccess(BaseEntityAccess[T], Iterable):
        relatively quickly, but it also means that iterator access only
        works correctly if you have something holding the Hypervisor
        connection open.'''
-    def __iter__(self: Self) -> Iterator[T]:
-        with self._parent:
-            link = self._get_parent_link()
+    __slots__ = ()
 
-            match getattr(link, self._list_func)():
-                case None:
-                    return iter([])
-                case entities:
-                    return iter(self._entity_class(x, self._parent) for x in self._filter_entities(entities))
+    def __iter__(self: Self) -> Iterator[T]:
+        return iter(self._entity_class(x, self._parent) for x in self._filter_entities(self._list_entities()))
 
     def get(self: Self, key: Any, /) -> T | None:
         '''Look up an entity by a general identifier.
@@ -206,15 +239,19 @@ class EntityAccess(BaseEntityAccess[T], Iterable):
         return ret
 
     def match(self: Self, match: MatchArgument, /) -> Iterable[T]:
-        '''Return an iterable of entities that match given match parameters.'''
-        def f(entity: T) -> bool:
-            value = match[0].get_value(entity)
-
-            if isinstance(value, list):
-                return any(
-                    match[1].search(x) is not None for x in value
-                )
-            else:
-                return match[1].search(value) is not None
-
-        return filter(f, self)
+        '''Return an iterable of entities that match given match parameters.
+
+           Matches against entity names are checked against the
+           underlying libvirt objects directly, so wrappers are only
+           constructed for entities that actually match.'''
+        target, pattern = match
+
+        if target.xpath is None and target.property == 'name':
+            search = pattern.search
+
+            return iter(
+                self._entity_class(x, self._parent) for x in self._filter_entities(self._list_entities())
+                if search(x.name()) is not None
+            )
+
+        return filter(matcher(*match), self)
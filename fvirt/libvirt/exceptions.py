@@ -137,8 +137,10 @@ class libvirtCallWrapper(Generic[W]):
         self.__callable_cache: dict[str, Callable] = dict()
 
     def __getattr__(self: Self, v: str) -> Any:
-        if v in self.__callable_cache:
-            return self.__callable_cache[v]
+        cached = self.__callable_cache.get(v)
+
+        if cached is not None:
+            return cached
 
         item = getattr(self.__wrapped, v)
 
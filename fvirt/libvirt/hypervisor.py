@@ -6,7 +6,11 @@
 from __future__ import annotations
 
 import logging
+import os
+import weakref
 
+from math import inf
+from time import monotonic
 from types import TracebackType
 from typing import TYPE_CHECKING, Any, Final, Self, cast
 
@@ -17,12 +21,52 @@ from .uri import LIBVIRT_URI, URI
 from ..version import VersionNumber
 
 if TYPE_CHECKING:
+    from collections.abc import Iterable
+
     from .domain import Domain, DomainAccess
     from .entity import Entity
     from .storage_pool import StoragePool, StoragePoolAccess
 
 LOGGER: Final = logging.getLogger(__name__)
 
+# How long (in seconds) a listing of entities is reused for.
+LIST_CACHE_TTL: Final = 0.5
+
+
+def _close_connection(pid: int, uri: str, conn_box: list[Any], /) -> None:
+    '''Close any connection left open by a garbage-collected Hypervisor.
+
+       `conn_box` is a single-item list holding the current connection,
+       so that this does not need a reference to the Hypervisor itself.
+
+       `pid` is the ID of the process that created the Hypervisor. If
+       this is called in any other process (such as a forked child
+       running exit handlers), it does nothing, as the connection
+       belongs to the parent.'''
+    if os.getpid() != pid:
+        return
+
+    LOGGER.debug(f'Tearing down hypervisor connection for URI: {uri}')
+
+    conn = conn_box[0]
+    conn_box[0] = None
+
+    if conn is not None and conn.isAlive():
+        conn.unregisterCloseCallback()
+        conn.close()
+
+
+# TODO: Figure out some way to test reconnect handling
+def _reconnect(_conn: Any, _reason: int, hv_ref: weakref.ref[Hypervisor], /) -> None:
+    '''Close callback used to re-establish a lost connection.
+
+       This only holds a weak reference to the Hypervisor, so that
+       libvirt holding the callback does not keep the Hypervisor alive.'''
+    hv = hv_ref()
+
+    if hv is not None:
+        hv._reconnect()
+
 
 class HostInfo:
     '''Class representing basic information about a Hypervisor host.'''
@@ -162,6 +206,21 @@ class Hypervisor:
 
        The underlying libvirt APIs are all concurrent-access safe
        irrespective of the concurrency model in use.'''
+    __slots__ = (
+        '__canonical_uri',
+        '__conn_box',
+        '__conn_count',
+        '__domains',
+        '__list_cache',
+        '__lock',
+        '__read_only',
+        '__storage_pools',
+        '__uri_str',
+        '__weakref__',
+        '_connection',
+        '_uri',
+    )
+
     def __init__(self: Self, /, hvuri: LIBVIRT_URI, *, read_only: bool = False) -> None:
         import threading
 
@@ -169,12 +228,18 @@ class Hypervisor:
         from .storage_pool import StoragePoolAccess
 
         self._uri = hvuri
+        self.__uri_str = str(hvuri)
+        self.__canonical_uri: URI | None = None
         self.__lock = threading.RLock()
         self.__read_only = bool(read_only)
 
         with self.__lock:
             self._connection: libvirtCallWrapper[libvirt.virConnect] | None = None
             self.__conn_count = 0
+            self.__list_cache: dict[tuple[str, int], tuple[float, tuple[Any, ...]]] = dict()
+            self.__conn_box: list[libvirtCallWrapper[libvirt.virConnect] | None] = [None]
+
+        weakref.finalize(self, _close_connection, os.getpid(), self.__uri_str, self.__conn_box)
 
         self.__domains = DomainAccess(self)
 
@@ -182,22 +247,8 @@ class Hypervisor:
 
         LOGGER.debug(f'Initialized new hypervisor instance: {repr(self)}')
 
-    def __del__(self: Self) -> None:
-        with self.__lock:
-            LOGGER.debug(f'Tearing down hypervisor instance: {repr(self)}')
-
-            if self.__conn_count > 0:
-                self.__conn_count = 0
-
-            if self._connection is not None:
-                if self._connection.isAlive():
-                    self._connection.unregisterCloseCallback()
-                    self._connection.close()
-
-                self._connection = None
-
     def __repr__(self: Self) -> str:
-        return f'<fvirt.libvirt.Hypervisor: uri={ str(self._uri) }, ro={ self.read_only }, conns={ self.__conn_count }>'
+        return f'<fvirt.libvirt.Hypervisor: uri={ self.__uri_str }, ro={ self.read_only }, conns={ self.__conn_count }>'
 
     def __bool__(self: Self) -> bool:
         with self.__lock:
@@ -226,22 +277,77 @@ class Hypervisor:
 
         with self:
             entity = getattr(self._connection, method)(config, flags)
+            self._invalidate_lists()
 
             return entity_class(entity, self)
 
+    def __define_entities(self: Self, entity_class: type[Entity], method: str, configs: Iterable[str], flags: int = 0) -> tuple[Entity, ...]:
+        if self.read_only:
+            raise InsufficientPrivileges
+
+        with self:
+            define = getattr(self._connection, method)
+            entities: list[Entity] = []
+
+            try:
+                for config in configs:
+                    entities.append(entity_class(define(config, flags), self))
+            finally:
+                self._invalidate_lists()
+
+            return tuple(entities)
+
+    def _list_entities(self: Self, method: str, flags: int = 0, /, *, persist: bool = False) -> tuple[Any, ...]:
+        '''List entities using the named virConnect method and flags.
+
+           While the connection is held open, the result is reused for
+           up to LIST_CACHE_TTL seconds, so that iterating the same
+           entities several times in quick succession only needs one
+           call to libvirt. Closing the connection, defining or creating
+           entities through this Hypervisor, or changing their lifecycle
+           state through fvirt.libvirt discards any cached results.
+
+           If `persist` is True, a fresh listing is always fetched,
+           and it is then reused until it is discarded for one of the
+           above reasons instead of expiring.'''
+        with self:
+            now = monotonic()
+
+            with self.__lock:
+                cached = self.__list_cache.get((method, flags))
+
+                if not persist and cached is not None and now < cached[0]:
+                    return cached[1]
+
+                entities = tuple(getattr(self._connection, method)(flags) or ())
+                self.__list_cache[(method, flags)] = (inf if persist else now + LIST_CACHE_TTL, entities)
+
+            return entities
+
+    def _invalidate_lists(self: Self) -> None:
+        '''Discard any cached entity listings.'''
+        with self.__lock:
+            self.__list_cache.clear()
+
     @property
     def read_only(self: Self) -> bool:
         return self.__read_only
 
     @property
     def uri(self: Self) -> URI:
-        '''The canonicalized URI for this Hypervisor connection.'''
-        with self:
-            assert self._connection is not None
-            uri = URI.from_string(self._connection.getURI())
+        '''The canonicalized URI for this Hypervisor connection.
+
+           This is looked up from libvirt the first time it is needed,
+           and then remembered for the lifetime of the instance.'''
+        if self.__canonical_uri is None:
+            with self:
+                assert self._connection is not None
+                uri = URI.from_string(self._connection.getURI())
 
-        assert isinstance(uri, URI)
-        return uri
+            assert isinstance(uri, URI)
+            self.__canonical_uri = uri
+
+        return self.__canonical_uri
 
     @property
     def lib_version(self: Self) -> VersionNumber:
@@ -318,16 +424,6 @@ class Hypervisor:
            In most cases, it is preferred to use either the context
            manager interface, or property access, both of which will
            handle connections correctly for you.'''
-        # TODO: Figure out some way to test reconnect handling
-        def cb(*args: Any, **kwargs: Any) -> None:
-            with self.__lock:
-                if self.read_only:
-                    self._connection = libvirtCallWrapper(call_libvirt(lambda: libvirt.openReadOnly(str(self._uri))))
-                else:
-                    self._connection = libvirtCallWrapper(call_libvirt(lambda: libvirt.open(str(self._uri))))
-
-                self._connection.registerCloseCallback(cb, None)
-
         with self.__lock:
             new_connect = False
 
@@ -346,23 +442,37 @@ class Hypervisor:
             if new_connect:
                 LOGGER.debug(f'Opening new connection for hypervisor instance: {repr(self)}')
 
-                if self.read_only:
-                    self._connection = libvirtCallWrapper(call_libvirt(lambda: libvirt.openReadOnly(str(self._uri))))
-                else:
-                    self._connection = libvirtCallWrapper(call_libvirt(lambda: libvirt.open(str(self._uri))))
-
-                self._connection.registerCloseCallback(cb, None)
+                self.__connect()
                 self.__conn_count += 1
             else:
 
                 if self.__conn_count == 0:
                     LOGGER.critical(f'Internal consistency error detected: {repr(self)} has an active connection but a connection count of 0.')
 
-                LOGGER.debug(f'Registering new connection user for hypervisor instance: {repr(self)}')
+                LOGGER.debug('Registering new connection user for hypervisor instance: %r', self)
                 self.__conn_count += 1
 
         return self
 
+    def __connect(self: Self) -> None:
+        '''Open a new underlying libvirt connection.
+
+           This must be called with the instance lock held.'''
+        self.__list_cache.clear()
+
+        if self.read_only:
+            self._connection = libvirtCallWrapper(call_libvirt(lambda: libvirt.openReadOnly(self.__uri_str)))
+        else:
+            self._connection = libvirtCallWrapper(call_libvirt(lambda: libvirt.open(self.__uri_str)))
+
+        self.__conn_box[0] = self._connection
+        self._connection.registerCloseCallback(_reconnect, weakref.ref(self))
+
+    def _reconnect(self: Self, /) -> None:
+        '''Re-establish a lost connection.'''
+        with self.__lock:
+            self.__connect()
+
     def close(self: Self) -> None:
         '''Reduce the connection count for this Hypervisor.
 
@@ -386,13 +496,41 @@ class Hypervisor:
                         self._connection.close()
 
                     self._connection = None
+                    self.__conn_box[0] = None
                     self.__conn_count = 0
+                    self.__list_cache.clear()
                 else:
-                    LOGGER.debug(f'Unregistering user for hypervisor connection: {repr(self)}')
+                    LOGGER.debug('Unregistering user for hypervisor connection: %r', self)
                     self.__conn_count -= 1
             else:
                 self.__conn_count = 0
 
+    def prefetch(self: Self) -> None:
+        '''Fetch the lists of domains and storage pools in one pass.
+
+           This replaces any cached listings with fresh ones, which
+           are then used for iteration, matching, and counting of
+           domains and storage pools (including running domains by ID)
+           without any further calls to libvirt.
+
+           Prefetched listings do not expire on their own. They are
+           kept until the connection is closed, or until entities are
+           defined, created, or have their lifecycle state changed
+           through fvirt.libvirt. Changes made outside of fvirt.libvirt
+           will not be seen until then, so this is only useful while
+           the connection is held open.
+
+           Single-entity lookups by key are always passed through to
+           libvirt, and are not affected by this.'''
+        from .domain import DomainAccess, DomainsByID
+        from .storage_pool import StoragePoolAccess
+
+        keys = {(cls._list_func, cls._list_flags) for cls in (DomainAccess, DomainsByID, StoragePoolAccess)}
+
+        with self:
+            for method, flags in keys:
+                self._list_entities(method, flags, persist=True)
+
     def define_domain(self: Self, /, config: str) -> Domain:
         '''Define a domain from an XML config string.
 
@@ -409,6 +547,29 @@ class Hypervisor:
 
         return cast(Domain, self.__define_entity(Domain, 'defineXMLFlags', config, 0))
 
+    def define_domains(self: Self, /, configs: Iterable[str]) -> tuple[Domain, ...]:
+        '''Define a domain for each of a sequence of XML config strings.
+
+           This is equivalent to calling define_domain() for each config,
+           but only opens the connection once for the whole batch.
+
+           If defining any domain fails, the error is raised immediately,
+           and any domains defined before the failure remain defined.
+
+           Raises fvirt.libvirt.NotConnected if called on a Hypervisor
+           instance that is not connected.
+
+           Raises fvirt.libvirt.InvalidConfig if any config is not a
+           valid libvirt domain configuration.
+
+           Returns a tuple of Domain instances in the same order as
+           the configs.'''
+        from .domain import Domain
+
+        LOGGER.info(f'Creating new persistent domains in hypervisor: {repr(self)}')
+
+        return cast(tuple[Domain, ...], self.__define_entities(Domain, 'defineXMLFlags', configs, 0))
+
     def create_domain(self: Self, /, config: str, *, paused: bool = False, reset_nvram: bool = False, auto_destroy: bool = False) -> Domain:
         '''Create a domain from an XML config string.
 
@@ -463,6 +624,30 @@ class Hypervisor:
 
         return cast(StoragePool, self.__define_entity(StoragePool, 'storagePoolDefineXML', config, 0))
 
+    def define_storage_pools(self: Self, /, configs: Iterable[str]) -> tuple[StoragePool, ...]:
+        '''Define a storage pool for each of a sequence of XML config strings.
+
+           This is equivalent to calling define_storage_pool() for each
+           config, but only opens the connection once for the whole batch.
+
+           If defining any storage pool fails, the error is raised
+           immediately, and any storage pools defined before the failure
+           remain defined.
+
+           Raises fvirt.libvirt.NotConnected if called on a Hypervisor
+           instance that is not connected.
+
+           Raises fvirt.libvirt.InvalidConfig if any config is not a
+           valid libvirt storage pool configuration.
+
+           Returns a tuple of StoragePool instances in the same order
+           as the configs.'''
+        from .storage_pool import StoragePool
+
+        LOGGER.info(f'Creating new persistent storage pools in hypervisor: {repr(self)}')
+
+        return cast(tuple[StoragePool, ...], self.__define_entities(StoragePool, 'storagePoolDefineXML', configs, 0))
+
     def create_storage_pool(self: Self, /, config: str, *, build: bool = True, overwrite: bool | None = None) -> StoragePool:
         '''Create a storage pool from an XML config string.
 
@@ -8,15 +8,20 @@
    other threads or processes without imposing significant limitations
    on the process.
 
-   Note that these always create a _new_ Hypervisor instance to operate
-   on (this is required to support running in other processes), so the
-   number of concurrent calls is inherently limited to the number of
-   client connections that the target libvirt instance supports.'''
+   Note that these do not use any Hypervisor instance passed in from
+   the caller (this is required to support running in other processes).
+   Instead, each process keeps one shared Hypervisor instance per URI,
+   which is opened on first use and kept open until the process exits,
+   so repeated calls against the same URI reuse a single connection.'''
 
 from __future__ import annotations
 
+import atexit
+import os
+import threading
+
 from dataclasses import dataclass
-from typing import TYPE_CHECKING, Any, Generic, Literal, TypeVar, Union
+from typing import TYPE_CHECKING, Any, Final, Generic, Literal, TypeVar, Union
 from uuid import UUID
 
 from .entity import Entity
@@ -33,6 +38,11 @@ T1 = TypeVar('T1')
 T2 = TypeVar('T2')
 T3 = TypeVar('T3')
 
+# Keyed by PID as well as URI so that a forked child never tries to use
+# (or close) a connection it inherited from its parent.
+_HYPERVISORS: Final[dict[tuple[int, str], Hypervisor]] = dict()
+_HYPERVISORS_LOCK = threading.Lock()
+
 
 @dataclass(kw_only=True, slots=True)
 class RunnerResult(Generic[T1, T2, T3]):
@@ -48,6 +58,43 @@ class RunnerResult(Generic[T1, T2, T3]):
     exception: Exception | None = None
 
 
+def _get_hypervisor(uri: LIBVIRT_URI) -> Hypervisor:
+    '''Get the shared Hypervisor instance for a URI in this process.
+
+       The returned instance already holds an open connection, which
+       is only released when the process exits.'''
+    key = (os.getpid(), str(uri))
+
+    with _HYPERVISORS_LOCK:
+        hv = _HYPERVISORS.get(key)
+
+        if hv is None:
+            hv = Hypervisor(hvuri=uri).open()
+            _HYPERVISORS[key] = hv
+
+    return hv
+
+
+@atexit.register
+def _close_hypervisors() -> None:
+    '''Close the connections for all of this process’s shared Hypervisor instances.'''
+    pid = os.getpid()
+
+    with _HYPERVISORS_LOCK:
+        for key in [x for x in _HYPERVISORS.keys() if x[0] == pid]:
+            _HYPERVISORS.pop(key).close()
+
+
+def _reset_lock_after_fork() -> None:
+    '''Replace the cache lock in a forked child, as it may have been held when forking.'''
+    global _HYPERVISORS_LOCK
+
+    _HYPERVISORS_LOCK = threading.Lock()
+
+
+os.register_at_fork(after_in_child=_reset_lock_after_fork)
+
+
 def _start_event_loop(state: bool | Callable) -> None:
     '''Start the event loop if asked to do so.'''
     match state:
@@ -223,7 +270,7 @@ def run_hv_method(
     postproc: Callable[[Any], T2] = lambda x: x,
     start_event_loop: bool | Callable = False,
 ) -> RunnerResult[I1, T1 | None, T2]:
-    '''Call a Hypervisor method on a new Hypervisor with the given URI.
+    '''Call a Hypervisor method on the Hypervisor for the given URI.
 
        The method is called with positional arguments `arguments` and keyword
        arguments `kwarguments`.
@@ -241,7 +288,7 @@ def run_hv_method(
        can also be a callable to use to start the event loop.'''
     _start_event_loop(start_event_loop)
 
-    with Hypervisor(hvuri=uri) as hv:
+    with _get_hypervisor(uri) as hv:
         match _run_method(hv, method, ident, opaque, arguments, kwarguments):
             case RunnerResult() as r:
                 return r
@@ -287,7 +334,7 @@ def run_entity_method(
        running in a thread, or True if running in another process.'''
     _start_event_loop(start_event_loop)
 
-    with Hypervisor(hvuri=uri) as hv:
+    with _get_hypervisor(uri) as hv:
         match _get_entity(hv, hvprop, ident, opaque):
             case RunnerResult() as r:
                 return r
@@ -346,7 +393,7 @@ def run_sub_entity_method(
        running in a thread, or True if running in another process.'''
     _start_event_loop(start_event_loop)
 
-    with Hypervisor(hvuri=uri) as hv:
+    with _get_hypervisor(uri) as hv:
         match _get_entity(hv, hvprop, ident[0], opaque):
             case RunnerResult() as r:
                 return r
@@ -402,7 +449,7 @@ def set_entity_attribute(
        running in a thread, or True if running in another process.'''
     _start_event_loop(start_event_loop)
 
-    with Hypervisor(hvuri=uri) as hv:
+    with _get_hypervisor(uri) as hv:
         match _get_entity(hv, hvprop, ident, opaque):
             case RunnerResult() as r:
                 return r
@@ -447,7 +494,7 @@ def set_sub_entity_attribute(
        running in a thread, or True if running in another process.'''
     _start_event_loop(start_event_loop)
 
-    with Hypervisor(hvuri=uri) as hv:
+    with _get_hypervisor(uri) as hv:
         match _get_entity(hv, hvprop, ident[0], opaque):
             case RunnerResult() as r:
                 return r
@@ -52,6 +52,10 @@ class StoragePool(RunnableEntity):
 
        The volumes in the pool can be accessed via the `volumes` property
        using the EntityAccess protocol.'''
+    __slots__ = (
+        '__volumes',
+    )
+
     MATCH_ALIASES: ClassVar = {
         'autostart': MatchAlias(property='autostart', desc='Match on whether the pool is set to autostart or not.'),
         'device': MatchAlias(property='devices', desc='Match on the pool devices.'),
@@ -64,6 +68,20 @@ class StoragePool(RunnableEntity):
         'type': MatchAlias(property='pool_type', desc='Match on the pool type.'),
     }
 
+    _format_properties: ClassVar[frozenset[str]] = RunnableEntity._format_properties | {
+        'allocated',
+        'autostart',
+        'available',
+        'capacity',
+        'devices',
+        'dir',
+        'format',
+        'hosts',
+        'num_volumes',
+        'pool_type',
+        'target',
+    }
+
     pool_type: ConfigProperty[str] = ConfigProperty(
         doc='The storage pool type.',
         path='./@type',
@@ -131,22 +149,6 @@ class StoragePool(RunnableEntity):
     def _wrapped_class(self: Self) -> Any:
         return libvirt.virStoragePool
 
-    @property
-    def _format_properties(self: Self) -> set[str]:
-        return super()._format_properties | {
-            'allocated',
-            'autostart',
-            'available',
-            'capacity',
-            'devices',
-            'dir',
-            'format',
-            'hosts',
-            'num_volumes',
-            'pool_type',
-            'target',
-        }
-
     @property
     def _define_method(self: Self) -> str:
         return 'define_storage_pool'
@@ -240,7 +242,7 @@ class StoragePool(RunnableEntity):
            success.'''
         self._check_valid()
 
-        if self._hv.read_only:
+        if self._read_only:
             raise InsufficientPrivileges
 
         if not self._hv.connected:
@@ -259,31 +261,25 @@ class StoragePool(RunnableEntity):
 
 class StoragePools(BaseEntityAccess[StoragePool]):
     '''Storage pool access mixin.'''
-    @property
-    def _count_funcs(self: Self) -> Iterable[str]:
-        return {'numOfStoragePools', 'numOfDefinedStoragePools'}
-
-    @property
-    def _list_func(self: Self) -> str:
-        return 'listAllStoragePools'
+    __slots__ = ()
 
-    @property
-    def _entity_class(self: Self) -> type:
-        return StoragePool
+    _count_funcs: ClassVar[Iterable[str]] = ('numOfStoragePools', 'numOfDefinedStoragePools')
+    _list_func: ClassVar[str] = 'listAllStoragePools'
+    _entity_class: ClassVar[type] = StoragePool
 
 
 class StoragePoolsByName(NameMap[StoragePool], StoragePools):
     '''Immutabkle mapping returning storage pools on a Hypervisor based on their names.'''
-    @property
-    def _lookup_func(self: Self) -> str:
-        return 'storagePoolLookupByName'
+    __slots__ = ()
+
+    _lookup_func: ClassVar[str] = 'storagePoolLookupByName'
 
 
 class StoragePoolsByUUID(UUIDMap[StoragePool], StoragePools):
     '''Immutabkle mapping returning storage pools on a Hypervisor based on their UUIDs.'''
-    @property
-    def _lookup_func(self: Self) -> str:
-        return 'storagePoolLookupByUUIDString'
+    __slots__ = ()
+
+    _lookup_func: ClassVar[str] = 'storagePoolLookupByUUIDString'
 
 
 class StoragePoolAccess(EntityAccess[StoragePool], StoragePools):
@@ -294,6 +290,11 @@ class StoragePoolAccess(EntityAccess[StoragePool], StoragePools):
 
        StoragePoolAccess instances are also sized, with len(instance)
        returning the total number of storage pools on the Hypervisor.'''
+    __slots__ = (
+        '__by_name',
+        '__by_uuid',
+    )
+
     def __init__(self: Self, parent: Hypervisor) -> None:
         self.__by_name = StoragePoolsByName(parent)
         self.__by_uuid = StoragePoolsByUUID(parent)
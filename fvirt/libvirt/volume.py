@@ -41,6 +41,8 @@ class Volume(Entity):
        config values other than `name` are read-only. Configuration
        updates should be made by rewriting either the `config` or
        `configRaw`.'''
+    __slots__ = ()
+
     MATCH_ALIASES: ClassVar = {
         'format': MatchAlias(property='format', desc='Match on the volume format.'),
         'key': MatchAlias(property='key', desc='Match on the volume key.'),
@@ -49,6 +51,16 @@ class Volume(Entity):
         'type': MatchAlias(property='vol_type', desc='Match on the volume type.'),
     }
 
+    _format_properties: ClassVar[frozenset[str]] = frozenset({
+        'name',
+        'allocated',
+        'capacity',
+        'key',
+        'path',
+        'vol_type',
+        'format',
+    })
+
     allocated: ConfigProperty[int] = ConfigProperty(
         doc='The actual space allocated to the volume.',
         path='./allocation',
@@ -106,22 +118,6 @@ class Volume(Entity):
     def _eq_properties(self: Self) -> set[str]:
         return {'name', 'key'}
 
-    @property
-    def _format_properties(self: Self) -> set[str]:
-        return {
-            'name',
-            'allocated',
-            'capacity',
-            'key',
-            'path',
-            'vol_type',
-            'format',
-        }
-
-    @property
-    def _mark_invalid_on_undefine(self: Self) -> bool:
-        return True
-
     @property
     def _define_target(self: Self) -> StoragePool:
         return self._parent  # type: ignore
@@ -348,28 +344,24 @@ class Volume(Entity):
 
 class Volumes(BaseEntityAccess[Volume]):
     '''Volume access mixin for Entity access protocol.'''
-    @property
-    def _count_funcs(self: Self) -> Iterable[str]:
-        return {'numOfVolumes'}
-
-    @property
-    def _list_func(self: Self) -> str:
-        return 'listAllVolumes'
+    __slots__ = ()
 
-    @property
-    def _entity_class(self: Self) -> type:
-        return Volume
+    _count_funcs: ClassVar[Iterable[str]] = ('numOfVolumes',)
+    _list_func: ClassVar[str] = 'listAllVolumes'
+    _entity_class: ClassVar[type] = Volume
 
 
 class VolumesByName(NameMap[Volume], Volumes):
     '''Immutable mapping returning volumes on a StoragePool based on their names.'''
-    @property
-    def _lookup_func(self: Self) -> str:
-        return 'storageVolLookupByName'
+    __slots__ = ()
+
+    _lookup_func: ClassVar[str] = 'storageVolLookupByName'
 
 
 class VolumesByKey(EntityMap[Volume], Volumes):
     '''Immutable mapping returning Volumes on a StoragePool based on their key.'''
+    __slots__ = ()
+
     def _get_key(self: Self, entity: Any) -> str:
         return cast(str, entity.key())
 
@@ -379,9 +371,7 @@ class VolumesByKey(EntityMap[Volume], Volumes):
 
         return key
 
-    @property
-    def _lookup_func(self: Self) -> str:
-        return 'storageVolLookupByKey'
+    _lookup_func: ClassVar[str] = 'storageVolLookupByKey'
 
 
 class VolumeAccess(EntityAccess[Volume], Volumes):
@@ -392,6 +382,11 @@ class VolumeAccess(EntityAccess[Volume], Volumes):
 
        VolumeAccess instances are also sized, with len(instance) returning
        the total number of volumes on the StoragePool.'''
+    __slots__ = (
+        '__by_name',
+        '__by_key',
+    )
+
     def __init__(self: Self, parent: StoragePool) -> None:
         self.__by_name = VolumesByName(parent)
         self.__by_key = VolumesByKey(parent)
@@ -5,6 +5,7 @@
 
 from __future__ import annotations
 
+import functools
 import re
 
 from dataclasses import dataclass
@@ -13,6 +14,8 @@ from typing import TYPE_CHECKING, Final, Self
 from lxml import etree
 
 if TYPE_CHECKING:
+    from collections.abc import Callable, Sequence
+
     from ..libvirt.entity import Entity
 
 MATCH_HELP: Final = '''
@@ -34,6 +37,10 @@ The match pattern may be any Python regular expression, as supported by the
 in match patterns, but all other features of Python regular expressions
 are fully supported.
 
+The --match option may be specified more than once, as long as every
+instance uses the same match target. In that case, an object matches if
+it matches any of the given patterns.
+
 To see a list of recognized match aliases for a given subcommand, run
 `fvirt <subcommand> help aliases`
 '''.lstrip().rstrip()
@@ -54,7 +61,7 @@ class MatchAlias:
     desc: str
 
 
-@dataclass(kw_only=True, slots=True)
+@dataclass(kw_only=True, slots=True, frozen=True)
 class MatchTarget:
     '''Class representing a target for matching.
 
@@ -79,20 +86,114 @@ class MatchTarget:
 
             return str(result)
         elif self.property is not None:
-            if hasattr(entity, self.property):
-                ret = getattr(entity, self.property, '')
+            # hasattr() would evaluate the property, so just use a default.
+            ret = getattr(entity, self.property, '')
 
-                if isinstance(ret, list):
-                    return [str(x) for x in ret]
-                else:
-                    return str(ret)
+            if isinstance(ret, list):
+                return [str(x) for x in ret]
             else:
-                return ''
+                return str(ret)
         else:
             return ''
 
 
-MatchArgument = tuple[MatchTarget, re.Pattern]
+@dataclass(slots=True, frozen=True)
+class MultiPattern:
+    '''A group of regular expressions that match if any of them match.
+
+       This provides the subset of the re.Pattern interface used by
+       fvirt.util.match.matcher(). Each pattern is searched separately,
+       so group numbering, backreferences, and inline flags behave
+       exactly as they would for that pattern on its own.'''
+    patterns: tuple[re.Pattern, ...]
+
+    @property
+    def pattern(self: Self) -> tuple[str, ...]:
+        '''The source strings of the grouped patterns.'''
+        return tuple(p.pattern for p in self.patterns)
+
+    def search(self: Self, string: str, /) -> re.Match | None:
+        '''Return the first match found by any of the patterns, or None.'''
+        for p in self.patterns:
+            if (m := p.search(string)) is not None:
+                return m
+
+        return None
+
+
+MatchArgument = tuple[MatchTarget, re.Pattern | MultiPattern]
+
+
+def combine_matches(matches: Sequence[MatchArgument], /) -> MatchArgument:
+    '''Combine a sequence of match arguments into a single match argument.
+
+       All of the match arguments must use the same target. The
+       resultant pattern will match if any of the original patterns
+       would have matched.
+
+       A ValueError is raised if `matches` is empty or if the targets
+       differ.'''
+    if not matches:
+        raise ValueError('At least one match argument is required.')
+    elif len(matches) == 1:
+        return matches[0]
+
+    target = matches[0][0]
+
+    for t, _ in matches[1:]:
+        if t.property != target.property or getattr(t.xpath, 'path', None) != getattr(target.xpath, 'path', None):
+            raise ValueError('All match arguments must use the same match target.')
+
+    patterns: list[re.Pattern] = []
+
+    for _, p in matches:
+        if isinstance(p, MultiPattern):
+            patterns.extend(p.patterns)
+        else:
+            patterns.append(p)
+
+    return (target, MultiPattern(tuple(patterns)))
+
+
+@functools.lru_cache(maxsize=128)
+def matcher(target: MatchTarget, pattern: re.Pattern | MultiPattern, /) -> Callable[[Entity], bool]:
+    '''Produce a function that checks if an entity matches.
+
+       The returned function takes an entity and returns True if the
+       value of `target` for that entity matches `pattern`.
+
+       Results are cached, so repeated calls with the same target and
+       pattern return the same function instead of building a new one.'''
+    search = pattern.search
+
+    # Specialize the predicate for the type of target, binding everything
+    # it needs as default arguments so each call does as little work
+    # as possible.
+    if target.xpath is not None:
+        def match_xpath(entity: Entity, _get_value: Callable[[Entity], str | list[str]] = target.get_value, _search: Callable = search) -> bool:
+            return _search(_get_value(entity)) is not None
+
+        return match_xpath
+    elif target.property is not None:
+        def match_property(entity: Entity, _prop: str = target.property, _search: Callable = search) -> bool:
+            # hasattr() would evaluate the property, so just use a default.
+            value = getattr(entity, _prop, '')
+
+            if isinstance(value, list):
+                return any(
+                    _search(str(x)) is not None for x in value
+                )
+            else:
+                return _search(str(value)) is not None
+
+        return match_property
+    else:
+        result = search('') is not None
+
+        def match_empty(entity: Entity) -> bool:
+            return result
+
+        return match_empty
 
 
 __all__ = [
@@ -100,4 +201,7 @@ __all__ = [
     'MatchArgument',
     'MatchTarget',
     'MATCH_HELP',
+    'MultiPattern',
+    'combine_matches',
+    'matcher',
 ]
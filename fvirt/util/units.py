@@ -57,6 +57,9 @@ IEC_FACTOR_TO_NAME: Final = frozendict({
     2 ** 60: 'EiB',
 })
 
+_SI_FACTORS: Final = tuple(sorted(SI_FACTOR_TO_NAME.keys()))
+_IEC_FACTORS: Final = tuple(sorted(IEC_FACTOR_TO_NAME.keys()))
+
 
 def unit_to_bytes(value: int | float, unit: str, /) -> int:
     '''Convert a value with units to integral bytes.
@@ -70,7 +73,7 @@ def unit_to_bytes(value: int | float, unit: str, /) -> int:
 
        If the conversion would return a fractional number of bytes,
        the result is rounded up.'''
-    if not (isinstance(value, int) or isinstance(value, float)):
+    if not isinstance(value, (int, float)):
         raise TypeError(f'{ value } is not an integer or float.')
     elif value < 0:
         raise ValueError('Conversion is only supported for positive values.')
@@ -80,6 +83,10 @@ def unit_to_bytes(value: int | float, unit: str, /) -> int:
     if factor is None:
         raise ValueError(f'Unrecognized unit name "{ unit }".')
 
+    # Integer multiplication is already exact, so only floats need rounding.
+    if type(value) is int:
+        return value * factor
+
     return math.ceil(value * factor)
 
 
@@ -113,12 +120,12 @@ def bytes_to_unit(value: int, /, *, iec: bool = False) -> tuple[float, str]:
     elif value < 0:
         raise ValueError('Value must be a positive integer.')
 
-    factors = SI_FACTOR_TO_NAME
-
     if iec:
         factors = IEC_FACTOR_TO_NAME
-
-    factor = __get_factor(value, factors.keys())
+        factor = __get_factor(value, _IEC_FACTORS)
+    else:
+        factors = SI_FACTOR_TO_NAME
+        factor = __get_factor(value, _SI_FACTORS)
 
     return (
         value / factor,
@@ -28,6 +28,7 @@ class VersionNumber:
         '__major',
         '__minor',
         '__release',
+        '__parts',
     )
 
     def __init__(self: Self, /, major: int, minor: int, release: int) -> None:
@@ -43,6 +44,7 @@ class VersionNumber:
         self.__major = major
         self.__minor = minor
         self.__release = release
+        self.__parts = (major, minor, release)
 
     def __repr__(self: Self) -> str:
         return f'{ self.major }.{ self.minor }.{ self.release }'
@@ -51,47 +53,28 @@ class VersionNumber:
         return repr(self)
 
     def __hash__(self: Self) -> int:
-        return hash(f'{self.major:0>4}{self.minor:0>4}{self.release:0>4}')
+        return hash(self.__parts)
 
     def __eq__(self: Self, item: Any) -> bool:
         if not isinstance(item, VersionNumber):
             return False
 
-        return (self.major == item.major and
-                self.minor == item.minor and
-                self.release == item.release)
+        return self.__parts == item.__parts
 
     def __lt__(self: Self, item: Any) -> bool:
         if not isinstance(item, VersionNumber):
             return NotImplemented
 
-        if self.major < item.major:
-            return True
-        elif self.major == item.major:
-            if self.minor < item.minor:
-                return True
-            elif self.minor == item.minor:
-                if self.release < item.release:
-                    return True
-
-        return False
+        return self.__parts < item.__parts
 
     def __len__(self: Self) -> int:
         return 3
 
     def __iter__(self: Self) -> Iterator[int]:
-        return iter((self.major, self.minor, self.release))
+        return iter(self.__parts)
 
     def __getitem__(self: Self, idx: int) -> int:
-        match idx:
-            case 0 | -3:
-                return self.major
-            case 1 | -2:
-                return self.minor
-            case 2 | -1:
-                return self.release
-            case _:
-                raise IndexError
+        return self.__parts[idx]
 
     @property
     def major(self: Self) -> int:
@@ -111,10 +94,8 @@ class VersionNumber:
     @staticmethod
     def from_libvirt_version(version: int, /) -> VersionNumber:
         '''Parse a libvirt version number into a VersionNumber.'''
-        vstr = str(version)
-        release = int(vstr[-3:].lstrip('0') or '0')
-        minor = int(vstr[-6:-3].lstrip('0') or '0')
-        major = int(vstr[:-6].lstrip('0') or '0')
+        major, rest = divmod(version, 1_000_000)
+        minor, release = divmod(rest, 1_000)
         return VersionNumber(major, minor, release)
 
     @staticmethod
@@ -17,7 +17,7 @@ import pytest
 from click.testing import CliRunner
 
 from fvirt.commands._base.objects import DisplayProperty
-from fvirt.commands._base.tables import ColumnsParam, color_bool, color_optional, column_info, render_table, tabulate_entities
+from fvirt.commands._base.tables import ColumnsParam, color_bool, color_mapped, color_optional, column_info, render_table, tabulate_entities
 
 if TYPE_CHECKING:
     from collections.abc import Sequence
@@ -73,6 +73,19 @@ def test_color_bool(i: bool, e: str) -> None:
     assert e in result
 
 
+@pytest.mark.parametrize('i, e', (
+    ('a', 'a'),
+    ('b', 'b'),
+    (1, '1'),
+))
+def test_color_mapped(i: Any, e: str) -> None:
+    '''Check that the color_mapped function renders values correctly.'''
+    result = color_mapped(i, {'a': 'bold', 1: 'bright_green_on_black'})
+
+    assert isinstance(result, str)
+    assert e in result
+
+
 @pytest.mark.parametrize('i, e', (
     (None, '-'),
     ('-', '-'),
@@ -117,6 +130,19 @@ def test_tabulate_entities(test_dom: tuple[Domain, Hypervisor], cols: Sequence[s
         assert results[0][idx] == getattr(dom, TEST_COLUMNS[col].prop)
 
 
+def test_tabulate_entities_pool(test_dom: tuple[Domain, Hypervisor]) -> None:
+    '''Test the tabulate_entities function with a thread pool.'''
+    from concurrent.futures import ThreadPoolExecutor
+
+    dom, _ = test_dom
+    cols = list(TEST_COLUMNS.keys())
+
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        results = tabulate_entities([dom, dom, dom], TEST_COLUMNS, cols, pool=pool)
+
+    assert results == tabulate_entities([dom, dom, dom], TEST_COLUMNS, cols)
+
+
 def test_render_table_without_titles() -> None:
     '''Test rendering tables without titles included.'''
     results = render_table(
@@ -172,6 +198,16 @@ def test_render_table_with_titles() -> None:
             assert items[j] == SELECTED_TEST_COLUMNS[j].color(TEST_LINES[i - 2][j])
 
 
+def test_render_table_empty() -> None:
+    '''Test rendering tables with no rows.'''
+    assert render_table([], SELECTED_TEST_COLUMNS, headings=False) == ''
+
+    result_lines = render_table([], SELECTED_TEST_COLUMNS, headings=True).splitlines()
+
+    assert len(result_lines) == 2
+    assert result_lines[0].split() == [x.title for x in SELECTED_TEST_COLUMNS]
+
+
 def test_columns_param_list(column_test_cmd: click.Command) -> None:
     '''Test list functionality of ColumnsParam.'''
     cli_runner = CliRunner(mix_stderr=False)
@@ -53,3 +53,8 @@ def test_list_only(runner: Callable[[Sequence[str], int], Result], test_uri: str
     result = runner(('-c', test_uri, 'domain', 'list', '--only', a), 0)
 
     assert set(e) == set(result.output.splitlines())
+
+
+def test_fail_if_no_match(runner: Callable[[Sequence[str], int], Result], test_uri: str) -> None:
+    '''Test that fail-if-no-match mode works when a match finds nothing.'''
+    runner(('-c', test_uri, '--fail-if-no-match', 'domain', 'list', '--match', 'name', '^nonexistent$'), 3)
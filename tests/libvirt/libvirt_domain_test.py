@@ -8,6 +8,7 @@ from __future__ import annotations
 import re
 
 from time import sleep
+from types import SimpleNamespace
 from typing import TYPE_CHECKING, Any, Type
 from uuid import UUID
 
@@ -16,6 +17,7 @@ import pytest
 from lxml import etree
 
 from fvirt.libvirt import Domain, DomainState, EntityNotRunning, Hypervisor, InvalidConfig, LifecycleResult
+from fvirt.libvirt.domain import DomainsByID
 from fvirt.util.match import MatchArgument, MatchTarget
 
 from .shared import (check_entity_access_get, check_entity_access_iterable, check_entity_access_mapping, check_entity_access_match,
@@ -103,6 +105,17 @@ def test_define(test_hv: Hypervisor, test_dom_xml: Callable[[], str]) -> None:
     assert isinstance(result, Domain)
 
 
+def test_define_many(test_hv: Hypervisor, test_dom_xml: Callable[[], str]) -> None:
+    '''Check that defining several domains at once works.'''
+    xml = [test_dom_xml() for _ in range(0, 3)]
+
+    result = test_hv.define_domains(xml)
+
+    assert len(result) == 3
+    assert all(isinstance(x, Domain) for x in result)
+    assert all(x.name in test_hv.domains.by_name for x in result)
+
+
 def test_config_raw(test_dom: tuple[Domain, Hypervisor]) -> None:
     '''Test the config_raw property.'''
     dom, _ = test_dom
@@ -150,6 +163,79 @@ def test_config(test_dom: tuple[Domain, Hypervisor]) -> None:
     compare_xml_trees(dom.config, conf)
 
 
+def test_config_cache(test_dom: tuple[Domain, Hypervisor]) -> None:
+    '''Test that configuration is only cached inside an entity context.'''
+    dom, _ = test_dom
+
+    assert dom._read_config() is not dom._read_config()
+
+    with dom:
+        cached = dom._read_config()
+
+        assert dom._read_config() is cached
+        assert dom.config is not cached
+        compare_xml_trees(dom.config, cached)
+
+        dom.config = dom.config
+
+        assert dom._read_config() is not cached
+
+    assert dom._config_cache is None
+
+
+def test_current_cpus_fallback(test_dom: tuple[Domain, Hypervisor]) -> None:
+    '''Test that current_cpus falls back to max_cpus when no current count is set.'''
+    dom, _ = test_dom
+
+    vcpu = dom._read_config().find('./vcpu')
+
+    assert vcpu is not None
+    assert vcpu.get('current') is None
+    assert dom.current_cpus == dom.max_cpus
+
+
+def test_update_config_childless(test_dom: tuple[Domain, Hypervisor]) -> None:
+    '''Test that config updates work on elements without children.'''
+    dom, _ = test_dom
+
+    assert dom.update_config_attribute('./clock', 'offset', 'localtime')
+    assert dom.update_config_element('./vcpu', '2')
+    assert not dom.update_config_element('./nonexistent', '2')
+
+    e = dom.config.find('./clock')
+    assert e is not None
+    assert e.get('offset') == 'localtime'
+
+
+def test_config_edit(test_dom: tuple[Domain, Hypervisor]) -> None:
+    '''Test batching configuration changes with the edit method.'''
+    dom, _ = test_dom
+
+    with pytest.raises(RuntimeError):
+        with dom.edit() as conf:
+            e = conf.find('/clock')
+            assert e is not None
+            e.attrib['offset'] = 'localtime'
+            raise RuntimeError
+
+    e = dom.config.find('/clock')
+    assert e is not None
+    assert e.attrib['offset'] != 'localtime'
+
+    with dom.edit() as conf:
+        e = conf.find('/clock')
+        assert e is not None
+        e.attrib['offset'] = 'localtime'
+
+        e = dom.config.find('/clock')
+        assert e is not None
+        assert e.attrib['offset'] != 'localtime'
+
+    e = dom.config.find('/clock')
+    assert e is not None
+    assert e.attrib['offset'] == 'localtime'
+
+
 def test_invalid_config(test_dom: tuple[Domain, Hypervisor], capfd: pytest.CaptureFixture) -> None:
     '''Test trying to use a bogus config with the config property.'''
     dom, _ = test_dom
@@ -251,6 +337,30 @@ def test_start(test_dom: tuple[Domain, Hypervisor]) -> None:
     check_runnable_start(dom)
 
 
+def test_lifecycle_lists(test_dom: tuple[Domain, Hypervisor]) -> None:
+    '''Check that listings of running domains follow lifecycle changes.'''
+    dom, hv = test_dom
+
+    with hv:
+        dom.destroy()
+
+        count = len(hv.domains.by_id)
+
+        dom.start()
+
+        dom_id = dom.id
+
+        assert dom_id in list(hv.domains.by_id)
+        assert len(hv.domains.by_id) == count + 1
+
+        dom.managed_save()
+
+        assert dom_id not in list(hv.domains.by_id)
+        assert len(hv.domains.by_id) == count
+
+        dom.start()
+
+
 def test_shutdown(test_dom: tuple[Domain, Hypervisor]) -> None:
     '''Check that shutting down a domain works.'''
     dom, _ = test_dom
@@ -505,6 +615,25 @@ def test_domain_access_mapping(test_hv: Hypervisor, p: str, k: Sequence[Any], c:
     check_entity_access_mapping(test_hv.domains, p, k, c, Domain)
 
 
+def test_domains_by_id_consistent(test_hv: Hypervisor) -> None:
+    '''Check that iteration, len(), and lookup agree for domains by ID.'''
+    entities = (SimpleNamespace(ID=lambda: 0), SimpleNamespace(ID=lambda: 3))
+
+    assert [x.ID() for x in DomainsByID._filter_entities(entities)] == [3]
+
+    by_id = test_hv.domains.by_id
+
+    with test_hv:
+        keys = list(by_id)
+
+        assert len(by_id) == len(keys)
+        assert 0 not in by_id
+
+        for k in keys:
+            assert k in by_id
+            assert by_id[k].id == k
+
+
 @pytest.mark.parametrize('data', (
     {
         'name': 'test',
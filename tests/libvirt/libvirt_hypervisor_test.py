@@ -6,13 +6,15 @@
 from __future__ import annotations
 
 from socket import getfqdn, gethostname
+from time import sleep
 from typing import cast
 
+import libvirt
 import pytest
 
 from fvirt.libvirt import Hypervisor, InsufficientPrivileges
 from fvirt.libvirt.entity_access import EntityAccess
-from fvirt.libvirt.hypervisor import HostInfo
+from fvirt.libvirt.hypervisor import LIST_CACHE_TTL, HostInfo
 from fvirt.libvirt.uri import LIBVIRT_DEFAULT_URI, URI
 from fvirt.version import VersionNumber
 
@@ -160,3 +162,42 @@ def test_entities(test_hv: Hypervisor, t: str) -> None:
     assert hasattr(test_hv, t)
 
     assert isinstance(getattr(test_hv, t), EntityAccess)
+
+
+def test_list_cache(test_hv: Hypervisor) -> None:
+    '''Check that entity listings are only reused while the connection is held open.'''
+    with test_hv:
+        first = test_hv._list_entities('listAllDomains')
+
+        assert test_hv._list_entities('listAllDomains') is first
+
+        test_hv._invalidate_lists()
+
+        second = test_hv._list_entities('listAllDomains')
+
+        assert second is not first
+
+    with test_hv:
+        assert test_hv._list_entities('listAllDomains') is not second
+
+
+def test_prefetch(test_hv: Hypervisor) -> None:
+    '''Check that prefetched listings persist until invalidated.'''
+    with test_hv:
+        test_hv.prefetch()
+
+        domains = test_hv._list_entities('listAllDomains')
+        running = test_hv._list_entities('listAllDomains', libvirt.VIR_CONNECT_LIST_DOMAINS_ACTIVE)
+        pools = test_hv._list_entities('listAllStoragePools')
+
+        sleep(LIST_CACHE_TTL * 2)
+
+        assert test_hv._list_entities('listAllDomains') is domains
+        assert test_hv._list_entities('listAllDomains', libvirt.VIR_CONNECT_LIST_DOMAINS_ACTIVE) is running
+        assert test_hv._list_entities('listAllStoragePools') is pools
+        assert len(test_hv.domains) == len(domains)
+        assert len(test_hv.domains.by_id) == len(running)
+
+        test_hv._invalidate_lists()
+
+        assert test_hv._list_entities('listAllDomains') is not domains
@@ -196,3 +196,6 @@ def check_entity_access_mapping(ea: EntityAccess, prop: str, keys: Sequence[Any]
 
     for k in keys:
         assert em[k]
+        assert k in em
+
+    assert object() not in em
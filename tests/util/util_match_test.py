@@ -5,11 +5,15 @@
 
 from __future__ import annotations
 
+import re
+
 from typing import Self
 
+import pytest
+
 from lxml import etree
 
-from fvirt.util.match import MatchTarget
+from fvirt.util.match import MatchTarget, combine_matches, matcher
 
 TMPL = '''
 <root>
@@ -100,3 +104,88 @@ def test_match_target_path3() -> None:
     assert results == {
         str(x) for x in INDICES
     }
+
+
+def test_matcher() -> None:
+    '''Check that matcher produces a working predicate.'''
+    f = matcher(MatchTarget(property='name'), re.compile('^name[01]$'))
+
+    results = {
+        o.id for o in TEST_OBJECTS if f(o)  # type: ignore
+    }
+
+    assert results == {0, 1}
+
+
+def test_matcher_cached() -> None:
+    '''Check that matcher reuses predicates for identical arguments.'''
+    pattern = re.compile('^name1$')
+
+    assert matcher(MatchTarget(property='name'), pattern) is matcher(MatchTarget(property='name'), pattern)
+
+
+def test_match_target_property_missing() -> None:
+    '''Check MatchTarget behavior for nonexistent properties.'''
+    target = MatchTarget(property='nonexistent')
+
+    results = {
+        target.get_value(o) for o in TEST_OBJECTS  # type: ignore
+    }
+
+    assert results == {''}
+
+
+def test_combine_matches() -> None:
+    '''Check that combine_matches merges patterns for the same target.'''
+    match = combine_matches((
+        (MatchTarget(property='name'), re.compile('^name0$')),
+        (MatchTarget(property='name'), re.compile('^name2$')),
+    ))
+
+    f = matcher(*match)
+
+    results = {
+        o.id for o in TEST_OBJECTS if f(o)  # type: ignore
+    }
+
+    assert results == {0, 2}
+
+
+def test_combine_matches_backreferences() -> None:
+    '''Check that combined patterns keep their own group numbering.'''
+    _, pattern = combine_matches((
+        (MatchTarget(property='name'), re.compile(r'(a)\1')),
+        (MatchTarget(property='name'), re.compile(r'(b)\1')),
+    ))
+
+    assert pattern.search('aa') is not None
+    assert pattern.search('bb') is not None
+    assert pattern.search('ab') is None
+
+
+def test_combine_matches_inline_flags() -> None:
+    '''Check that combined patterns keep their own inline flags.'''
+    _, pattern = combine_matches((
+        (MatchTarget(property='name'), re.compile('(?i)^NAME0$')),
+        (MatchTarget(property='name'), re.compile('^name2$')),
+    ))
+
+    assert pattern.search('name0') is not None
+    assert pattern.search('name2') is not None
+    assert pattern.search('NAME2') is None
+
+
+def test_combine_matches_single() -> None:
+    '''Check that combine_matches passes through a single match unmodified.'''
+    match = (MatchTarget(property='name'), re.compile('^name0$'))
+
+    assert combine_matches((match,)) is match
+
+
+def test_combine_matches_mismatched_targets() -> None:
+    '''Check that combine_matches rejects differing targets.'''
+    with pytest.raises(ValueError):
+        combine_matches((
+            (MatchTarget(property='name'), re.compile('^name0$')),
+            (MatchTarget(property='id'), re.compile('^1$')),
+        ))
@@ -61,6 +61,13 @@ def test_conversion(u: str, e: int) -> None:
     assert unit_to_bytes(1, u) == e
 
 
+def test_conversion_rounding() -> None:
+    '''Test that fractional results are rounded up and integral results are exact.'''
+    assert unit_to_bytes(1.5, 'B') == 2
+    assert unit_to_bytes(0.5, 'KiB') == 512
+    assert unit_to_bytes(2 ** 60, 'EiB') == 2 ** 120
+
+
 def test_invalid_unit() -> None:
     '''Test that an invalid unit throws an error.'''
     with pytest.raises(ValueError, match='Unrecognized unit name'):
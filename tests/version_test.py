@@ -75,6 +75,7 @@ def test_version_hash() -> None:
     (1, VersionNumber(0, 0, 1)),
     (1000, VersionNumber(0, 1, 0)),
     (1000000, VersionNumber(1, 0, 0)),
+    (9010002, VersionNumber(9, 10, 2)),
 ))
 def test_VersionNumber_libvirt_parse(v: int, t: VersionNumber) -> None:
     '''Test that parsing libvirt version numbers works correctly.'''